@@ -7,15 +7,23 @@ tools for controlling Ableton Live via OSC through the OSC daemon.
 
 The server communicates with the OSC daemon via TCP socket, which in turn
 communicates with Ableton Live via OSC using the AbletonOSC Remote Script.
+Requests are sent as length-prefixed JSON frames tagged with a request id, so
+concurrent tool calls share the connection without waiting on each other.
 """
 
 import asyncio
+import functools
+import inspect
 import json
 import logging
+import mmap
 import os
 import socket
+import struct
 import sys
-from typing import List, Optional, Dict, Any, Tuple
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
 
 from mcp.server.fastmcp import FastMCP
 
@@ -27,58 +35,285 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for the daemon protocol when it is installed: it encodes
+# straight to bytes and is several times faster than the stdlib codec
+try:
+    import orjson
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj: Any) -> bytes:
+        # Non-ASCII characters are escaped, so the output is always ASCII
+        return json.dumps(obj, separators=(',', ':')).encode('ascii')
+    
+    def json_loads(data: Any) -> Any:
+        # The stdlib decoder does not take memoryviews
+        return json.loads(bytes(data))
+
+# With msgpack installed, requests are sent as msgpack to daemons that
+# accept it (see osc_daemon.py); it is cheaper to decode than JSON
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Length prefix preceding every message exchanged with the daemon
+FRAME_HEADER = struct.Struct('>I')
+
+# Bytes requested per socket read; a single read may carry many frames
+RECV_BUFFER_SIZE = 65536
+
+# Linux only: acknowledge received data immediately instead of delaying acks
+TCP_QUICKACK = getattr(socket, 'TCP_QUICKACK', None)
+
+# Parameterless requests, encoded once; only the id and closing brace vary
+PING_REQUEST = b'{"command":"ping","id":'
+STATUS_REQUEST = b'{"command":"get_status","id":'
+
+# Compact binary send_message frame (see osc_daemon.py) for the hot
+# fire-and-forget addresses: a FAST_SEND byte, the address id the daemon
+# interned, the argument count, the argument types, then the raw values
+FAST_SEND = 0x01
+FAST_ADDRESSES = (
+    '/live/track/set/volume',
+    '/live/device/set/parameter/value'
+)
+
+# OSC address prefixes that Ableton answers (see osc_daemon.py); messages to
+# any other address are fire-and-forget
+RESPONSE_PREFIXES = (
+    '/live/device/get',
+    '/live/scene/get',
+    '/live/view/get',
+    '/live/clip/get',
+    '/live/clip_slot/get',
+    '/live/track/get',
+    '/live/song/get',
+    '/live/api/get',
+    '/live/application/get',
+    '/live/test',
+    '/live/error'
+)
+
+# Layout of the daemon's telemetry ring buffer (see osc_daemon.py): a 32-byte
+# header, then records of (timestamp, track index, output meter level)
+TELEMETRY_HEADER = struct.Struct('<Q24x')
+TELEMETRY_RECORD = struct.Struct('<dIf16x')
+TELEMETRY_CAPACITY = 4096
+
 
 class AbletonClient:
     """
     Client for communicating with the OSC daemon.
     
     This client sends commands to the OSC daemon via TCP socket,
-    which then forwards them to Ableton Live via OSC.
-    """
-    
-    def __init__(self, host: str = '127.0.0.1', port: int = 65432, timeout: float = 10.0):
+    which then forwards them to Ableton Live via OSC. Each request carries
+    an id; a background reader task matches the daemon's responses back to
+    the waiting callers, so several commands can be in flight at once.
+    
+    Results of read-only queries are cached briefly, and writes drop the
+    cached results they may have changed.
+    """
+    
+    # Seconds a query result stays cached. Structural properties (counts and
+    # names) change at human time scales; playback state changes faster.
+    STATE_CACHE_TTL = 0.5
+    STRUCTURE_CACHE_TTL = 2.0
+    STRUCTURE_PROPERTIES = frozenset((
+        'num_tracks', 'track_names', 'num_scenes', 'scene_names', 'name',
+        'num_devices', 'devices/name', 'parameters/name', 'version'
+    ))
+    
+    # Properties that change continuously and are never cached
+    UNCACHED_PROPERTIES = frozenset((
+        'current_song_time', 'playing_position',
+        'output_meter_level', 'output_meter_left', 'output_meter_right'
+    ))
+    
+    # OSC domains whose first argument is a track index
+    TRACK_DOMAINS = ('track', 'device', 'clip', 'clip_slot')
+    
+    MAX_CACHE_ENTRIES = 1024
+    
+    # Seconds to wait for the daemon's response, by kind of request. Queries
+    # and plain commands get short deadlines so that a stalled daemon or
+    # Ableton is reported quickly; structural edits and batches, which can
+    # legitimately take a while, use the client timeout. A query's deadline
+    # goes to the daemon with it, so that the daemon stops waiting for
+    # Ableton then too; the client allows the margin on top for the
+    # daemon's answer to arrive.
+    QUERY_TIMEOUT = 1.0
+    COMMAND_TIMEOUT = 2.0
+    DAEMON_TIMEOUT_MARGIN = 0.5
+    STRUCTURE_ACTIONS = ('create_', 'delete_', 'duplicate_')
+    
+    # Reconnecting after the daemon drops the connection: the delay before
+    # each attempt doubles up to the maximum, for a limited number of attempts
+    RECONNECT_MIN_DELAY = 0.1
+    RECONNECT_MAX_DELAY = 5.0
+    RECONNECT_ATTEMPTS = 10
+    
+    def __init__(self, host: str = '127.0.0.1', port: int = 65432, timeout: float = 10.0,
+                 path: Optional[str] = None, telemetry_path: Optional[str] = None):
         """
         Initialize the Ableton client.
         
         Args:
             host: Host address of the OSC daemon
             port: Port of the OSC daemon
-            timeout: Socket timeout in seconds
+            timeout: Timeout in seconds for connecting, and for requests
+                that may take long, such as creating tracks or batches
+            path: Unix domain socket path of the OSC daemon; used instead of
+                host and port when given and supported by the platform
+            telemetry_path: The daemon's telemetry buffer file, if enabled
         """
         self.host = host
         self.port = port
+        self.path = path if path and hasattr(socket, 'AF_UNIX') else None
+        self.endpoint = self.path or f"{host}:{port}"
+        self.telemetry_path = telemetry_path
+        self._telemetry: Optional[mmap.mmap] = None
+        self.metered_tracks: set = set()
         self.timeout = timeout
         self.sock: Optional[socket.socket] = None
         self.connected = False
+        
+        # The event loop the connection and tasks below belong to; the
+        # server's lifespan connects on the loop running the MCP server
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Serializes connecting and writes to the socket; responses are
+        # awaited outside it
         self._lock = asyncio.Lock()
+        self._reconnect_lock = asyncio.Lock()
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._next_id = 0
+        self._reader_task: Optional[asyncio.Task] = None
+        
+        # An idle second connection, so that replacing a failed connection
+        # doesn't have to wait for a handshake
+        self._spare: Optional[socket.socket] = None
+        self._spare_task: Optional[asyncio.Task] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        
+        # Query cache: (address, args) -> (expiry time, response). The
+        # generation is bumped on every invalidation so that a query which
+        # was in flight during a write does not cache a stale result.
+        self._cache: Dict[Tuple[str, tuple], Tuple[float, Dict[str, Any]]] = {}
+        self._cache_generation = 0
+        
+        # Queries currently awaiting a response, so that identical
+        # concurrent queries share a single round trip
+        self._inflight: Dict[Tuple[str, tuple], asyncio.Future] = {}
         
-        logger.info(f"AbletonClient initialized (daemon: {host}:{port})")
+        # Daemon-assigned ids of FAST_ADDRESSES for compact binary frames,
+        # fetched once per connection
+        self._address_ids: Optional[Dict[str, int]] = None
+        self._fast_frames: Dict[str, Tuple[struct.Struct, bytes]] = {}
+        
+        # Whether the connected daemon accepts msgpack requests
+        self._use_msgpack = False
+        
+        # Fire-and-forget messages sent during the current event loop
+        # iteration, with the futures of their callers; they go to the
+        # daemon together as one bundle
+        self._tick_batch: List[Tuple[str, List[Any], asyncio.Future]] = []
+        self._tick_task: Optional[asyncio.Task] = None
+        
+        logger.info(f"AbletonClient initialized (daemon: {self.endpoint})")
     
-    def connect(self) -> bool:
+    async def connect(self) -> bool:
         """
         Connect to the OSC daemon.
         
+        The socket is non-blocking and driven by the running event loop,
+        which also owns the response reader task.
+        
         Returns:
             True if connection successful, False otherwise
         """
+        self._check_loop()
         if self.connected and self.sock:
             return True
         
+        # Promote the warm spare connection if there is a live one
+        sock = self._take_spare()
+        if sock is None:
+            try:
+                sock = await self._open_socket()
+            except (socket.error, asyncio.TimeoutError) as e:
+                logger.error(f"Failed to connect to OSC daemon: {e or 'timed out'}")
+                self.connected = False
+                self.sock = None
+                return False
+        
+        loop = asyncio.get_running_loop()
+        self.sock = sock
+        self.connected = True
+        self._address_ids = None  # interned ids belong to the daemon instance
+        # A new daemon has no meter listeners; have them started again
+        self.metered_tracks.clear()
+        self._use_msgpack = False
+        self._reader_task = loop.create_task(self._read_responses(sock))
+        if self._spare_task is None or self._spare_task.done():
+            self._spare_task = loop.create_task(self._open_spare())
+        logger.info(f"Connected to OSC daemon at {self.endpoint}")
+        
+        if msgpack is not None:
+            status = await self.get_daemon_status()
+            self._use_msgpack = sock is self.sock and 'msgpack' in status.get('codecs', ())
+        return True
+    
+    async def _open_socket(self) -> socket.socket:
+        """Open a new non-blocking connection to the daemon."""
+        if self.path:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            address = self.path
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            address = (self.host, self.port)
+            # Requests and responses are small; don't let Nagle hold them
+            # back, and let the kernel notice a daemon that went away silently
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        sock.setblocking(False)
         try:
-            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.sock.settimeout(self.timeout)
-            self.sock.connect((self.host, self.port))
-            self.connected = True
-            logger.info(f"Connected to OSC daemon at {self.host}:{self.port}")
-            return True
-        except socket.error as e:
-            logger.error(f"Failed to connect to OSC daemon: {e}")
-            self.connected = False
-            self.sock = None
-            return False
+            await asyncio.wait_for(asyncio.get_running_loop().sock_connect(sock, address),
+                                   timeout=self.timeout)
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+    
+    async def _open_spare(self) -> None:
+        """Open an idle spare connection for connect() to fall back on."""
+        if self._spare is not None:
+            return
+        try:
+            self._spare = await self._open_socket()
+        except (socket.error, asyncio.TimeoutError) as e:
+            logger.debug(f"Could not open spare daemon connection: {e or 'timed out'}")
+    
+    def _take_spare(self) -> Optional[socket.socket]:
+        """Return the spare connection if the daemon hasn't closed it."""
+        spare, self._spare = self._spare, None
+        if spare is None:
+            return None
+        try:
+            # An idle live connection has nothing to read
+            spare.recv(1, socket.MSG_PEEK)
+        except BlockingIOError:
+            return spare
+        except OSError:
+            pass
+        spare.close()
+        return None
     
     def disconnect(self) -> None:
         """Disconnect from the OSC daemon."""
+        if self._reader_task and not self._reader_task.done():
+            self._reader_task.cancel()
+        self._reader_task = None
         if self.sock:
             try:
                 self.sock.close()
@@ -86,77 +321,353 @@ class AbletonClient:
                 pass
             self.sock = None
         self.connected = False
+        self._fail_pending('Disconnected from OSC daemon')
         logger.info("Disconnected from OSC daemon")
     
-    def _ensure_connected(self) -> bool:
+    def close(self) -> None:
+        """Disconnect from the OSC daemon and drop the spare connection."""
+        for task in (self._spare_task, self._reconnect_task):
+            if task and not task.done():
+                task.cancel()
+        self._spare_task = None
+        self._reconnect_task = None
+        if self._spare:
+            self._spare.close()
+            self._spare = None
+        self.disconnect()
+    
+    def _check_loop(self) -> None:
+        """
+        Bind the client to the running event loop.
+        
+        The connection, its tasks and the locks belong to the loop that
+        made them. When the client is used from a new loop, such as a
+        second asyncio.run(), that state is dropped so that the connection
+        is made again on this loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            logger.info("Event loop changed; reconnecting to the OSC daemon")
+            for sock in (self.sock, self._spare):
+                if sock is not None:
+                    sock.close()
+            self.sock = None
+            self._spare = None
+            self.connected = False
+            self._reader_task = self._spare_task = self._reconnect_task = self._tick_task = None
+            self._lock = asyncio.Lock()
+            self._reconnect_lock = asyncio.Lock()
+            # Keep only what this loop's callers are waiting on
+            self._pending = {k: f for k, f in self._pending.items() if f.get_loop() is loop}
+            self._inflight = {k: f for k, f in self._inflight.items() if f.get_loop() is loop}
+            self._tick_batch = [entry for entry in self._tick_batch if entry[2].get_loop() is loop]
+        self._loop = loop
+    
+    async def _ensure_connected(self) -> bool:
         """Ensure we have a valid connection, reconnecting if necessary."""
-        if not self.connected or not self.sock:
-            return self.connect()
-        return True
+        self._check_loop()
+        if self.connected and self.sock:
+            return True
+        return await self._reconnect()
+    
+    async def _reconnect(self) -> bool:
+        """Reconnect to the daemon, sharing one attempt between concurrent callers."""
+        async with self._reconnect_lock:
+            # connect() returns immediately if another caller already reconnected
+            return await self.connect()
+    
+    async def _reconnect_with_backoff(self) -> None:
+        """Reconnect in the background after the daemon dropped the connection."""
+        delay = self.RECONNECT_MIN_DELAY
+        for _ in range(self.RECONNECT_ATTEMPTS):
+            await asyncio.sleep(delay)
+            if await self._reconnect():
+                return
+            delay = min(delay * 2, self.RECONNECT_MAX_DELAY)
+        logger.warning("Giving up reconnecting to OSC daemon until the next request")
+    
+    def _fail_pending(self, message: str) -> None:
+        """Resolve every in-flight request with an error response."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_result({'status': 'error', 'message': message})
+    
+    def _dispatch_response(self, body: memoryview) -> None:
+        """Decode one response frame and resolve the request waiting on it."""
+        try:
+            if body[:1] == b'{':
+                response = json_loads(body)
+            else:
+                response = msgpack.unpackb(body, raw=False)
+        except (ValueError, AttributeError) as e:
+            logger.error(f"Invalid response: {e}")
+            return
+        
+        future = self._pending.pop(response.pop('id', None), None)
+        if future and not future.done():
+            future.set_result(response)
     
-    async def send_command(self, command: str, **kwargs) -> Dict[str, Any]:
+    async def _read_responses(self, sock: socket.socket) -> None:
+        """
+        Read framed responses from the daemon until the connection closes,
+        resolving the future registered for each response id.
+        
+        Reads are done in large chunks and every complete frame in the
+        buffer is dispatched, so a burst of responses costs one recv. The
+        buffer is allocated once and read into directly; frames are decoded
+        from views of it without copying.
+        
+        Args:
+            sock: The connected daemon socket
+        """
+        loop = asyncio.get_running_loop()
+        buffer = bytearray(RECV_BUFFER_SIZE)
+        view = memoryview(buffer)
+        filled = 0
+        quickack = TCP_QUICKACK is not None and not self.path
+        lost = False
+        try:
+            while True:
+                if quickack:
+                    # Linux resets quickack mode after each ack, so re-arm it
+                    sock.setsockopt(socket.IPPROTO_TCP, TCP_QUICKACK, 1)
+                received = await loop.sock_recv_into(sock, view[filled:])
+                if not received:
+                    raise ConnectionError('Connection closed by daemon')
+                filled += received
+                
+                offset = 0
+                while filled - offset >= FRAME_HEADER.size:
+                    (length,) = FRAME_HEADER.unpack_from(buffer, offset)
+                    end = offset + FRAME_HEADER.size + length
+                    if filled < end:
+                        if end - offset > len(buffer):
+                            # Grow to fit a frame larger than the buffer
+                            grown = bytearray(end - offset)
+                            grown[:filled - offset] = view[offset:filled]
+                            view.release()
+                            buffer, view = grown, memoryview(grown)
+                            filled -= offset
+                            offset = 0
+                        break
+                    self._dispatch_response(view[offset + FRAME_HEADER.size:end])
+                    offset = end
+                
+                # Move any partial frame to the front
+                if offset:
+                    view[:filled - offset] = view[offset:filled]
+                    filled -= offset
+        except (ConnectionError, OSError) as e:
+            logger.error(f"Socket error: {e}")
+            lost = True
+        finally:
+            if sock is self.sock:
+                sock.close()
+                self.sock = None
+                self.connected = False
+                self._fail_pending('Connection closed by daemon')
+                self.metered_tracks.clear()
+                # Lost rather than closed by disconnect(): get it back. A
+                # cancelled reader (the loop shutting down) doesn't reconnect.
+                if lost and (self._reconnect_task is None or self._reconnect_task.done()):
+                    self._reconnect_task = loop.create_task(self._reconnect_with_backoff())
+    
+    async def send_command(self, command: str, payload: Optional[Dict[str, Any]] = None,
+                           timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         Send a command to the OSC daemon.
         
         Args:
             command: The command type (e.g., 'send_message', 'get_status')
-            **kwargs: Additional parameters for the command
+            payload: Additional parameters for the command
+            timeout: Seconds to wait for the response (default: the client timeout)
             
         Returns:
             The response from the daemon
         """
+        self._next_id += 1
+        request_id = self._next_id
+        if payload:
+            request = {'command': command, 'id': request_id, **payload}
+        else:
+            request = {'command': command, 'id': request_id}
+        request_data = msgpack.packb(request) if self._use_msgpack else json_dumps(request)
+        return await self._request(request_id, request_data, timeout or self.timeout)
+    
+    async def _send_fixed_command(self, prefix: bytes) -> Dict[str, Any]:
+        """Send a pre-encoded parameterless command, appending only its id."""
+        self._next_id += 1
+        request_id = self._next_id
+        return await self._request(request_id, b'%s%d}' % (prefix, request_id), self.COMMAND_TIMEOUT)
+    
+    async def _write_frame(self, body: bytes) -> bool:
+        """
+        Write one length-prefixed frame to the daemon.
+        
+        Args:
+            body: The frame body
+            
+        Returns:
+            False if no connection to the daemon could be made
+        """
+        # The connection is almost always up, so check it without the
+        # lock; only the write itself needs exclusive access
+        if not await self._ensure_connected():
+            return False
         async with self._lock:
-            if not self._ensure_connected():
+            sock = self.sock
+            if sock is None:
+                raise socket.error('Connection to OSC daemon lost')
+            try:
+                await asyncio.wait_for(
+                    asyncio.get_running_loop().sock_sendall(sock, FRAME_HEADER.pack(len(body)) + body),
+                    timeout=self.timeout
+                )
+            except asyncio.TimeoutError:
+                # A partially written frame leaves the stream unusable
+                self.disconnect()
+                raise
+        return True
+    
+    async def _request(self, request_id: int, request_data: bytes, timeout: float) -> Dict[str, Any]:
+        """
+        Send an encoded request and wait for the response with its id.
+        
+        Args:
+            request_id: The id carried by the request
+            request_data: The JSON-encoded request
+            timeout: Seconds to wait for the response
+            
+        Returns:
+            The response from the daemon
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        
+        try:
+            if not await self._write_frame(request_data):
                 return {
                     'status': 'error',
                     'message': 'Not connected to OSC daemon. Is osc_daemon.py running?'
                 }
             
-            # Build the request
-            request = {'command': command}
-            request.update(kwargs)
+            # Wait for the reader task to deliver the matching response
+            return await asyncio.wait_for(future, timeout=timeout)
             
-            try:
-                # Send the request
-                request_data = json.dumps(request).encode('utf-8')
-                self.sock.sendall(request_data)
-                
-                # Receive the response
-                response_data = self.sock.recv(8192)
-                if not response_data:
-                    self.connected = False
-                    return {
-                        'status': 'error',
-                        'message': 'Connection closed by daemon'
-                    }
-                
-                response = json.loads(response_data.decode('utf-8'))
-                return response
-                
-            except socket.timeout:
-                logger.error("Socket timeout waiting for response")
-                return {
-                    'status': 'error',
-                    'message': 'Timeout waiting for response from daemon'
-                }
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON response: {e}")
-                return {
-                    'status': 'error',
-                    'message': f'Invalid response from daemon: {e}'
-                }
-            except socket.error as e:
-                logger.error(f"Socket error: {e}")
-                self.connected = False
-                return {
-                    'status': 'error',
-                    'message': f'Communication error: {e}'
-                }
+        except asyncio.TimeoutError:
+            logger.error("Socket timeout waiting for response")
+            return {
+                'status': 'error',
+                'message': 'Timeout waiting for response from daemon'
+            }
+        except socket.error as e:
+            logger.error(f"Socket error: {e}")
+            self.connected = False
+            return {
+                'status': 'error',
+                'message': f'Communication error: {e}'
+            }
+        finally:
+            self._pending.pop(request_id, None)
+    
+    def _response_timeout(self, address: str) -> float:
+        """Return how long to wait for the response to a message to address."""
+        if '/get/' in address or address == '/live/test':
+            return self.QUERY_TIMEOUT
+        if address.rpartition('/')[2].startswith(self.STRUCTURE_ACTIONS):
+            return self.timeout
+        return self.COMMAND_TIMEOUT
+    
+    def _cache_ttl(self, address: str) -> Optional[float]:
+        """Return how long a response to address may be cached, or None."""
+        scope, separator, prop = address.partition('/get/')
+        if not separator or not scope.startswith('/live/') or prop in self.UNCACHED_PROPERTIES:
+            return None
+        return self.STRUCTURE_CACHE_TTL if prop in self.STRUCTURE_PROPERTIES else self.STATE_CACHE_TTL
+    
+    def _cache_lookup(self, key: Tuple[str, tuple]) -> Optional[Dict[str, Any]]:
+        """Return the cached response for key if it has not expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            self._cache.pop(key, None)
+            return None
+        return entry[1]
+    
+    def _cache_store(self, key: Tuple[str, tuple], ttl: float,
+                     response: Dict[str, Any], generation: int) -> None:
+        """Cache a successful query response unless a write happened since it was sent."""
+        if response.get('status') != 'success' or generation != self._cache_generation:
+            return
+        now = time.monotonic()
+        if len(self._cache) >= self.MAX_CACHE_ENTRIES:
+            self._cache = {k: v for k, v in self._cache.items() if v[0] >= now}
+            if len(self._cache) >= self.MAX_CACHE_ENTRIES:
+                self._cache.clear()
+        self._cache[key] = (now + ttl, response)
+    
+    def _invalidate_cache(self, address: str, args: List[Any]) -> None:
+        """
+        Drop cached query results that a write to address may have changed.
+        
+        Writes to a track, or to its devices and clips, only drop entries
+        for that track plus song-level entries such as track_names. View
+        writes only drop view entries. Anything else clears the cache.
+        """
+        self._cache_generation += 1
+        # Queries sent before the write must not be joined by later callers
+        self._inflight.clear()
+        if not self._cache:
+            return
+        
+        domain = address.split('/')[2] if address.count('/') >= 2 else ''
+        if domain in self.TRACK_DOMAINS and args:
+            track = args[0]
+            for key in list(self._cache):
+                key_domain = key[0].split('/')[2]
+                if key_domain == 'song' or (key_domain in self.TRACK_DOMAINS and key[1][:1] == (track,)):
+                    del self._cache[key]
+        elif domain == 'view':
+            for key in list(self._cache):
+                if key[0].startswith('/live/view/'):
+                    del self._cache[key]
+        else:
+            self._cache.clear()
+    
+    def cached_state_matches(self, address: str, args: List[Any], value: Any) -> bool:
+        """
+        Check whether a fresh cached query result already equals value.
+        
+        Args:
+            address: The query address (e.g., '/live/track/get/mute')
+            args: The query arguments, which Ableton echoes before the value
+            value: The value to compare against
+            
+        Returns:
+            True if the cached result is fresh and holds exactly value
+        """
+        try:
+            response = self._cache_lookup((address, tuple(args)))
+        except TypeError:
+            return False
+        if response is None:
+            return False
+        data = response.get('data', ())
+        return len(data) == len(args) + 1 and data[-1] == value
     
     async def send_osc(self, address: str, args: List[Any] = None) -> Dict[str, Any]:
         """
         Send an OSC message to Ableton Live.
         
+        Read-only queries are answered from the cache while fresh, and
+        identical queries issued concurrently share one request.
+        Fire-and-forget messages sent during the same event loop iteration
+        go to the daemon together as one bundle.
+        
         Args:
             address: The OSC address (e.g., '/live/song/get/tempo')
             args: Optional list of arguments
@@ -164,28 +675,313 @@ class AbletonClient:
         Returns:
             The response from Ableton (via daemon)
         """
-        return await self.send_command('send_message', address=address, args=args or [])
+        args = args or []
+        timeout = self._response_timeout(address)
+        payload = {'address': address, 'args': args, 'timeout': timeout}
+        timeout += self.DAEMON_TIMEOUT_MARGIN
+        ttl = self._cache_ttl(address)
+        if ttl is None:
+            # Uncached reads, such as current_song_time, change nothing
+            if not address.startswith(RESPONSE_PREFIXES):
+                self._invalidate_cache(address, args)
+                return await self._queue_send(address, args)
+            if self._tick_batch:
+                await self._flush_tick_batch()
+            return await self.send_command('send_message', payload, timeout)
+        
+        try:
+            key = (address, tuple(args))
+            cached = self._cache_lookup(key)
+        except TypeError:  # unhashable arguments cannot be cached
+            return await self.send_command('send_message', payload, timeout)
+        if cached is not None:
+            return cached
+        
+        # Let fire-and-forget messages queued before this query take effect
+        if self._tick_batch:
+            await self._flush_tick_batch()
+        
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # Shielded, so a cancelled caller doesn't cancel the shared request
+            return await asyncio.shield(inflight)
+        
+        generation = self._cache_generation
+        inflight = asyncio.ensure_future(self.send_command('send_message', payload, timeout))
+        self._inflight[key] = inflight
+        
+        def forget(done: asyncio.Future) -> None:
+            if self._inflight.get(key) is done:
+                del self._inflight[key]
+        
+        inflight.add_done_callback(forget)
+        response = await asyncio.shield(inflight)
+        self._cache_store(key, ttl, response, generation)
+        return response
+    
+    def _queue_send(self, address: str, args: List[Any]) -> asyncio.Future:
+        """
+        Queue a fire-and-forget message to go out with the others sent
+        during this event loop iteration.
+        
+        Returns:
+            A future resolving to the daemon's response for the message
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if not self._tick_batch:
+            loop.call_soon(self._start_tick_batch)
+        self._tick_batch.append((address, args, future))
+        return future
+    
+    def _start_tick_batch(self) -> None:
+        """Send the queued fire-and-forget messages, once the tick that queued them ends."""
+        if self._tick_batch:
+            self._tick_task = asyncio.get_running_loop().create_task(self._flush_tick_batch())
+    
+    async def _flush_tick_batch(self) -> None:
+        """
+        Send the queued fire-and-forget messages and resolve their futures.
+        
+        A single message is sent as is; several are sent as one bundle.
+        """
+        batch = self._tick_batch
+        if not batch:
+            return
+        self._tick_batch = []
+        
+        try:
+            if len(batch) == 1:
+                address, args, _ = batch[0]
+                responses = [await self.send_command(
+                    'send_message', {'address': address, 'args': args},
+                    self._response_timeout(address)
+                )]
+            else:
+                result = await self.send_command('send_bundle', {'messages': [
+                    {'address': address, 'args': args} for address, args, _ in batch
+                ]}, timeout=max(self._response_timeout(address) for address, _, _ in batch))
+                if result.get('status') == 'sent':
+                    responses = [{'status': 'sent', 'address': address} for address, _, _ in batch]
+                elif not result.get('rejected'):
+                    # The bundle may have reached Ableton anyway (e.g. the
+                    # daemon was slow to answer), and resending could repeat
+                    # commands such as delete_track
+                    responses = [{**result, 'address': address} for address, _, _ in batch]
+                else:
+                    # The daemon refused the bundle before sending any of it,
+                    # often for one bad message; send them one by one so
+                    # that only that message fails
+                    responses = await asyncio.gather(*[
+                        self.send_command('send_message', {'address': address, 'args': args},
+                                          self._response_timeout(address))
+                        for address, args, _ in batch
+                    ])
+            
+            for (_, _, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
+        finally:
+            # Don't leave callers waiting if sending was cancelled
+            for _, _, future in batch:
+                if not future.done():
+                    future.cancel()
+    
+    async def send_batch(self, messages: List[Tuple[str, List[Any]]]) -> List[Dict[str, Any]]:
+        """
+        Send several OSC messages to Ableton Live in one daemon round-trip.
+        
+        Args:
+            messages: (address, args) pairs to send, in order
+            
+        Returns:
+            One response per message, in the same order
+        """
+        for address, args in messages:
+            # Uncached reads, such as current_song_time, change nothing
+            if not address.startswith(RESPONSE_PREFIXES):
+                self._invalidate_cache(address, args or [])
+        await self._flush_tick_batch()
+        
+        generation = self._cache_generation
+        response = await self.send_command('send_batch', {'messages': [
+            {'address': address, 'args': args or []} for address, args in messages
+        ]})
+        responses = response.get('responses')
+        if response.get('status') != 'success' or not isinstance(responses, list):
+            return [response] * len(messages)
+        if len(responses) != len(messages):
+            return [{
+                'status': 'error',
+                'message': 'Malformed batch response from daemon'
+            }] * len(messages)
+        
+        for (address, args), result in zip(messages, responses):
+            ttl = self._cache_ttl(address)
+            if ttl is not None:
+                try:
+                    self._cache_store((address, tuple(args or [])), ttl, result, generation)
+                except TypeError:
+                    pass
+        return responses
+    
+    async def _intern_addresses(self) -> Dict[str, int]:
+        """Fetch the daemon's ids for FAST_ADDRESSES, or none if unsupported."""
+        sock = self.sock
+        response = await self.send_command('intern_addresses', {'addresses': list(FAST_ADDRESSES)},
+                                           timeout=self.COMMAND_TIMEOUT)
+        ids = response.get('ids') if response.get('status') == 'ok' else None
+        address_ids = ids if isinstance(ids, dict) else {}
+        if sock is self.sock:
+            self._address_ids = address_ids
+        return address_ids
+    
+    async def send_osc_fast(self, address: str, types: str, args: Sequence[Any]) -> Dict[str, Any]:
+        """
+        Send a fire-and-forget OSC message as a compact binary frame.
+        
+        The frame carries the daemon's interned id for the address and the
+        raw argument values, so neither side encodes or parses JSON. Falls
+        back to send_osc when the daemon doesn't support it.
+        
+        Args:
+            address: The OSC address, one of FAST_ADDRESSES
+            types: One struct format character per argument, 'i' for an
+                int32 or 'f' for a float32
+            args: The arguments
+            
+        Returns:
+            A status dict like the daemon's reply to fire-and-forget messages
+        """
+        address_ids = self._address_ids
+        if address_ids is None:
+            address_ids = await self._intern_addresses()
+        address_id = address_ids.get(address)
+        if address_id is None:
+            return await self.send_osc(address, list(args))
+        
+        fast_frame = self._fast_frames.get(types)
+        if fast_frame is None:
+            fast_frame = self._fast_frames[types] = (
+                struct.Struct(f'<BHB{len(types)}s{types}'), types.encode('ascii')
+            )
+        frame, type_tags = fast_frame
+        try:
+            body = frame.pack(FAST_SEND, address_id, len(types), type_tags, *args)
+        except struct.error:  # a value out of int32/float32 range
+            return await self.send_osc(address, list(args))
+        
+        self._invalidate_cache(address, list(args))
+        # Keep it behind fire-and-forget messages queued before it
+        if self._tick_batch:
+            await self._flush_tick_batch()
+        try:
+            if not await self._write_frame(body):
+                return {
+                    'status': 'error',
+                    'message': 'Not connected to OSC daemon. Is osc_daemon.py running?'
+                }
+        except asyncio.TimeoutError:
+            logger.error("Socket timeout sending to daemon")
+            return {
+                'status': 'error',
+                'message': 'Timeout sending to daemon'
+            }
+        except socket.error as e:
+            logger.error(f"Socket error: {e}")
+            self.connected = False
+            return {
+                'status': 'error',
+                'message': f'Communication error: {e}'
+            }
+        return {'status': 'sent', 'address': address}
+    
+    def read_track_levels(self) -> Optional[Dict[int, Tuple[float, float]]]:
+        """
+        Read the latest meter level of each track from the telemetry buffer.
+        
+        The buffer is shared memory written by the daemon, so this does not
+        touch the socket.
+        
+        Returns:
+            A dict of track index to (timestamp, level), or None if the
+            telemetry buffer is not available
+        """
+        if self._telemetry is None:
+            if not self.telemetry_path:
+                return None
+            try:
+                with open(self.telemetry_path, 'rb') as f:
+                    self._telemetry = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to open telemetry buffer: {e}")
+                return None
+        
+        # Copy the records out in one go; a record overwritten afterwards
+        # is newer anyway, and the newest timestamp per track wins
+        end = TELEMETRY_HEADER.size + TELEMETRY_CAPACITY * TELEMETRY_RECORD.size
+        records = self._telemetry[TELEMETRY_HEADER.size:end]
+        if len(records) % TELEMETRY_RECORD.size:
+            return None
+        
+        levels: Dict[int, Tuple[float, float]] = {}
+        for timestamp, track_index, level in TELEMETRY_RECORD.iter_unpack(records):
+            if timestamp > levels.get(track_index, (0.0,))[0]:
+                levels[track_index] = (timestamp, level)
+        return levels
+    
+    async def send_bundle(self, messages: List[Tuple[str, List[Any]]]) -> Dict[str, Any]:
+        """
+        Send several fire-and-forget OSC messages to Ableton as one OSC bundle.
+        
+        Args:
+            messages: (address, args) pairs, none of which expect a response
+            
+        Returns:
+            The daemon's response for the bundle as a whole
+        """
+        for address, args in messages:
+            self._invalidate_cache(address, args or [])
+        await self._flush_tick_batch()
+        return await self.send_command('send_bundle', {'messages': [
+            {'address': address, 'args': args or []} for address, args in messages
+        ]}, timeout=self.COMMAND_TIMEOUT)
     
     async def get_daemon_status(self) -> Dict[str, Any]:
         """Get the status of the OSC daemon."""
-        return await self.send_command('get_status')
+        return await self._send_fixed_command(STATUS_REQUEST)
     
     async def ping(self) -> Dict[str, Any]:
         """Ping the OSC daemon."""
-        return await self.send_command('ping')
+        return await self._send_fixed_command(PING_REQUEST)
+
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Connect to the OSC daemon when the server starts, not on the first tool call."""
+    await ableton_client.connect()
+    try:
+        yield
+    finally:
+        ableton_client.close()
 
 
 # Initialize the MCP server
 mcp = FastMCP(
     "Ableton Live Controller",
-    dependencies=["python-osc"]
+    dependencies=["python-osc", "orjson", "msgpack"],
+    lifespan=server_lifespan
 )
 
-# Create the Ableton client (will connect on first use)
+# Create the Ableton client (connects when the server starts, and
+# reconnects on demand)
 # Configuration can be overridden via environment variables
 daemon_host = os.environ.get('ABLETON_DAEMON_HOST', '127.0.0.1')
 daemon_port = int(os.environ.get('ABLETON_DAEMON_PORT', '65432'))
-ableton_client = AbletonClient(host=daemon_host, port=daemon_port)
+daemon_socket = os.environ.get('ABLETON_DAEMON_SOCKET')
+telemetry_path = os.environ.get('ABLETON_TELEMETRY_PATH')
+ableton_client = AbletonClient(host=daemon_host, port=daemon_port, path=daemon_socket,
+                               telemetry_path=telemetry_path)
 
 
 # =============================================================================
@@ -203,71 +999,147 @@ def format_response(response: Dict[str, Any], success_key: str = 'data') -> str:
     Returns:
         A formatted string representation
     """
-    if response.get('status') == 'success':
-        data = response.get(success_key, response.get('data'))
+    status = response.get('status')
+    if status == 'success':
+        data = response[success_key] if success_key in response else response.get('data')
         if isinstance(data, (list, tuple)):
             if len(data) == 1:
                 return str(data[0])
-            return ', '.join(str(item) for item in data)
+            return ', '.join(map(str, data))
         return str(data)
-    elif response.get('status') == 'sent':
+    elif status == 'sent':
         return "Command sent successfully"
-    elif response.get('status') == 'error':
+    elif status == 'error':
         return f"Error: {response.get('message', 'Unknown error')}"
     else:
         return str(response)
 
 
-# =============================================================================
-# Song Control Tools
-# =============================================================================
-
-@mcp.tool()
-async def play() -> str:
+def _query_value(data: Sequence[Any]) -> Any:
     """
-    Start playback in Ableton Live.
+    Return the value from the data of an indexed query response.
+    
+    Ableton echoes the queried index before the value ([index, value]);
+    a bare [value] is accepted too.
     
     Returns:
-        Status message indicating if playback started
+        The value, or None if the response carried no data
     """
-    response = await ableton_client.send_osc('/live/song/start_playing')
-    return format_response(response)
+    if len(data) >= 2:
+        return data[1]
+    return data[0] if data else None
 
 
-@mcp.tool()
-async def stop() -> str:
+def validate(**bounds: Tuple[Optional[float], Optional[float]]) -> Callable:
     """
-    Stop playback in Ableton Live.
+    Check numeric tool arguments against inclusive (low, high) bounds.
     
-    Returns:
-        Status message indicating if playback stopped
-    """
-    response = await ableton_client.send_osc('/live/song/stop_playing')
-    return format_response(response)
+    A tool called with an argument out of bounds returns an error message
+    without contacting the daemon. None leaves a side of a bound open.
+    
+    Args:
+        **bounds: (low, high) for each argument name to check
+    """
+    def describe(low: Optional[float], high: Optional[float]) -> str:
+        if high is None:
+            return f"at least {low}"
+        if low is None:
+            return f"at most {high}"
+        return f"between {low} and {high}"
+    
+    def decorator(func: Callable) -> Callable:
+        positions = {name: i for i, name in enumerate(inspect.signature(func).parameters)}
+        checks = tuple(
+            (name, positions[name], low, high, f"Error: {name} must be {describe(low, high)}")
+            for name, (low, high) in bounds.items()
+        )
+        
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            for name, position, low, high, error in checks:
+                if name in kwargs:
+                    value = kwargs[name]
+                elif position < len(args):
+                    value = args[position]
+                else:
+                    continue
+                if (low is not None and value < low) or (high is not None and value > high):
+                    return error
+            return await func(*args, **kwargs)
+        
+        return wrapper
+    
+    return decorator
 
 
-@mcp.tool()
-async def continue_playing() -> str:
+async def _dispatch(address: str, args: Optional[List[Any]] = None,
+                    on_success: Optional[Callable[[Sequence[Any]], str]] = None,
+                    on_sent: Optional[str] = None, types: Optional[str] = None,
+                    current: Optional[str] = None) -> str:
     """
-    Continue playback from the current position in Ableton Live.
+    Send an OSC message and turn the daemon's response into a tool result.
     
+    Args:
+        address: The OSC address to send to
+        args: Optional list of arguments
+        on_success: Formats the data of a successful query response
+        on_sent: Message to return once a fire-and-forget command is sent
+        types: Argument types, to send a fire-and-forget command as a
+            compact binary frame (see AbletonClient.send_osc_fast)
+        current: Query address for the state a setter changes; if its cached
+            result already equals the last argument, nothing is sent
+        
     Returns:
-        Status message
+        The formatted result, falling back to format_response
     """
-    response = await ableton_client.send_osc('/live/song/continue_playing')
+    if current is not None and on_sent is not None and \
+            ableton_client.cached_state_matches(current, args[:-1], args[-1]):
+        return on_sent
+    if types is not None:
+        response = await ableton_client.send_osc_fast(address, types, args)
+    else:
+        response = await ableton_client.send_osc(address, args)
+    # Most calls are fire-and-forget setters, so check for those first
+    status = response.get('status')
+    if status == 'sent':
+        if on_sent is not None:
+            return on_sent
+    elif status == 'success' and on_success is not None:
+        return on_success(response.get('data', ()))
     return format_response(response)
 
 
-@mcp.tool()
-async def stop_all_clips() -> str:
-    """
-    Stop all playing clips in Ableton Live.
+# =============================================================================
+# Song Control Tools
+# =============================================================================
+
+# Commands that take no arguments and return only a status message:
+# (tool name, OSC address, description)
+COMMAND_TOOLS = (
+    ('play', '/live/song/start_playing', "Start playback in Ableton Live."),
+    ('stop', '/live/song/stop_playing', "Stop playback in Ableton Live."),
+    ('continue_playing', '/live/song/continue_playing',
+     "Continue playback from the current position in Ableton Live."),
+    ('stop_all_clips', '/live/song/stop_all_clips', "Stop all playing clips in Ableton Live."),
+    ('undo', '/live/song/undo', "Undo the last action in Ableton Live."),
+    ('redo', '/live/song/redo', "Redo the last undone action in Ableton Live."),
+    ('tap_tempo', '/live/song/tap_tempo',
+     "Tap tempo in Ableton Live.\nCall this repeatedly to set tempo by tapping."),
+)
+
+
+def _register_command_tool(name: str, address: str, description: str) -> None:
+    """Register an MCP tool that sends a single argument-less OSC command."""
+    async def command_tool() -> str:
+        return await _dispatch(address)
     
-    Returns:
-        Status message
-    """
-    response = await ableton_client.send_osc('/live/song/stop_all_clips')
-    return format_response(response)
+    command_tool.__name__ = name
+    command_tool.__doc__ = f"{description}\n\nReturns:\n    Status message"
+    mcp.tool(name=name, description=command_tool.__doc__)(command_tool)
+
+
+for _name, _address, _description in COMMAND_TOOLS:
+    _register_command_tool(_name, _address, _description)
 
 
 @mcp.tool()
@@ -278,16 +1150,14 @@ async def get_tempo() -> str:
     Returns:
         The current tempo in BPM
     """
-    response = await ableton_client.send_osc('/live/song/get/tempo')
-    if response.get('status') == 'success':
-        data = response.get('data', ())
-        if data:
-            return f"Current tempo: {data[0]} BPM"
-        return "Could not retrieve tempo"
-    return format_response(response)
+    return await _dispatch(
+        '/live/song/get/tempo',
+        on_success=lambda data: f"Current tempo: {data[0]} BPM" if data else "Could not retrieve tempo"
+    )
 
 
 @mcp.tool()
+@validate(bpm=(20.0, 999.0))
 async def set_tempo(bpm: float) -> str:
     """
     Set the tempo (BPM) of the Ableton Live session.
@@ -298,13 +1168,8 @@ async def set_tempo(bpm: float) -> str:
     Returns:
         Status message confirming the tempo change
     """
-    if not 20.0 <= bpm <= 999.0:
-        return "Error: Tempo must be between 20.0 and 999.0 BPM"
-    
-    response = await ableton_client.send_osc('/live/song/set/tempo', [bpm])
-    if response.get('status') == 'sent':
-        return f"Tempo set to {bpm} BPM"
-    return format_response(response)
+    return await _dispatch('/live/song/set/tempo', [bpm], on_sent=f"Tempo set to {bpm} BPM",
+                           current='/live/song/get/tempo')
 
 
 @mcp.tool()
@@ -315,14 +1180,13 @@ async def get_is_playing() -> str:
     Returns:
         Whether playback is active
     """
-    response = await ableton_client.send_osc('/live/song/get/is_playing')
-    if response.get('status') == 'success':
-        data = response.get('data', ())
-        if data:
-            is_playing = bool(data[0])
-            return f"Playback is {'active' if is_playing else 'stopped'}"
-        return "Could not determine playback state"
-    return format_response(response)
+    return await _dispatch(
+        '/live/song/get/is_playing',
+        on_success=lambda data: (
+            f"Playback is {'active' if data[0] else 'stopped'}" if data
+            else "Could not determine playback state"
+        )
+    )
 
 
 @mcp.tool()
@@ -333,14 +1197,13 @@ async def get_metronome() -> str:
     Returns:
         Whether the metronome is enabled
     """
-    response = await ableton_client.send_osc('/live/song/get/metronome')
-    if response.get('status') == 'success':
-        data = response.get('data', ())
-        if data:
-            enabled = bool(data[0])
-            return f"Metronome is {'enabled' if enabled else 'disabled'}"
-        return "Could not retrieve metronome state"
-    return format_response(response)
+    return await _dispatch(
+        '/live/song/get/metronome',
+        on_success=lambda data: (
+            f"Metronome is {'enabled' if data[0] else 'disabled'}" if data
+            else "Could not retrieve metronome state"
+        )
+    )
 
 
 @mcp.tool()
@@ -354,10 +1217,11 @@ async def set_metronome(enabled: bool) -> str:
     Returns:
         Status message confirming the change
     """
-    response = await ableton_client.send_osc('/live/song/set/metronome', [int(enabled)])
-    if response.get('status') == 'sent':
-        return f"Metronome {'enabled' if enabled else 'disabled'}"
-    return format_response(response)
+    return await _dispatch(
+        '/live/song/set/metronome', [int(enabled)],
+        on_sent=f"Metronome {'enabled' if enabled else 'disabled'}",
+        current='/live/song/get/metronome'
+    )
 
 
 @mcp.tool()
@@ -368,14 +1232,13 @@ async def get_loop() -> str:
     Returns:
         Whether loop is enabled
     """
-    response = await ableton_client.send_osc('/live/song/get/loop')
-    if response.get('status') == 'success':
-        data = response.get('data', ())
-        if data:
-            enabled = bool(data[0])
-            return f"Loop is {'enabled' if enabled else 'disabled'}"
-        return "Could not retrieve loop state"
-    return format_response(response)
+    return await _dispatch(
+        '/live/song/get/loop',
+        on_success=lambda data: (
+            f"Loop is {'enabled' if data[0] else 'disabled'}" if data
+            else "Could not retrieve loop state"
+        )
+    )
 
 
 @mcp.tool()
@@ -389,47 +1252,11 @@ async def set_loop(enabled: bool) -> str:
     Returns:
         Status message confirming the change
     """
-    response = await ableton_client.send_osc('/live/song/set/loop', [int(enabled)])
-    if response.get('status') == 'sent':
-        return f"Loop {'enabled' if enabled else 'disabled'}"
-    return format_response(response)
-
-
-@mcp.tool()
-async def undo() -> str:
-    """
-    Undo the last action in Ableton Live.
-    
-    Returns:
-        Status message
-    """
-    response = await ableton_client.send_osc('/live/song/undo')
-    return format_response(response)
-
-
-@mcp.tool()
-async def redo() -> str:
-    """
-    Redo the last undone action in Ableton Live.
-    
-    Returns:
-        Status message
-    """
-    response = await ableton_client.send_osc('/live/song/redo')
-    return format_response(response)
-
-
-@mcp.tool()
-async def tap_tempo() -> str:
-    """
-    Tap tempo in Ableton Live.
-    Call this repeatedly to set tempo by tapping.
-    
-    Returns:
-        Status message
-    """
-    response = await ableton_client.send_osc('/live/song/tap_tempo')
-    return format_response(response)
+    return await _dispatch(
+        '/live/song/set/loop', [int(enabled)],
+        on_sent=f"Loop {'enabled' if enabled else 'disabled'}",
+        current='/live/song/get/loop'
+    )
 
 
 # =============================================================================
@@ -444,13 +1271,10 @@ async def get_num_tracks() -> str:
     Returns:
         The number of tracks
     """
-    response = await ableton_client.send_osc('/live/song/get/num_tracks')
-    if response.get('status') == 'success':
-        data = response.get('data', ())
-        if data:
-            return f"Number of tracks: {data[0]}"
-        return "Could not retrieve track count"
-    return format_response(response)
+    return await _dispatch(
+        '/live/song/get/num_tracks',
+        on_success=lambda data: f"Number of tracks: {data[0]}" if data else "Could not retrieve track count"
+    )
 
 
 @mcp.tool()
@@ -469,21 +1293,18 @@ async def get_track_names(index_min: Optional[int] = None, index_max: Optional[i
     if index_min is not None and index_max is not None:
         args = [index_min, index_max]
     
-    response = await ableton_client.send_osc('/live/song/get/track_names', args)
-    if response.get('status') == 'success':
-        data = response.get('data', ())
-        if data:
-            tracks = list(data)
-            result = "Tracks:\n"
-            for i, name in enumerate(tracks):
-                idx = (index_min or 0) + i
-                result += f"  [{idx}] {name}\n"
-            return result.strip()
-        return "No tracks found"
-    return format_response(response)
+    def on_success(data):
+        if not data:
+            return "No tracks found"
+        lines = ["Tracks:"]
+        lines.extend(f"  [{idx}] {name}" for idx, name in enumerate(data, index_min or 0))
+        return "\n".join(lines)
+    
+    return await _dispatch('/live/song/get/track_names', args, on_success=on_success)
 
 
 @mcp.tool()
+@validate(track_index=(0, None))
 async def get_track_name(track_index: int) -> str:
     """
     Get the name of a specific track.
@@ -494,18 +1315,17 @@ async def get_track_name(track_index: int) -> str:
     Returns:
         The track name
     """
-    response = await ableton_client.send_osc('/live/track/get/name', [track_index])
-    if response.get('status') == 'success':
-        data = response.get('data', ())
-        if len(data) >= 2:  # Returns [track_index, name]
-            return f"Track {track_index}: {data[1]}"
-        elif data:
-            return f"Track {track_index}: {data[0]}"
-        return f"Could not get name for track {track_index}"
-    return format_response(response)
+    def on_success(data):
+        name = _query_value(data)
+        if name is None:
+            return f"Could not get name for track {track_index}"
+        return f"Track {track_index}: {name}"
+    
+    return await _dispatch('/live/track/get/name', [track_index], on_success=on_success)
 
 
 @mcp.tool()
+@validate(track_index=(0, None))
 async def set_track_name(track_index: int, name: str) -> str:
     """
     Set the name of a specific track.
@@ -517,13 +1337,14 @@ async def set_track_name(track_index: int, name: str) -> str:
     Returns:
         Status message confirming the change
     """
-    response = await ableton_client.send_osc('/live/track/set/name', [track_index, name])
-    if response.get('status') == 'sent':
-        return f"Track {track_index} renamed to '{name}'"
-    return format_response(response)
+    return await _dispatch(
+        '/live/track/set/name', [track_index, name],
+        on_sent=f"Track {track_index} renamed to '{name}'"
+    )
 
 
 @mcp.tool()
+@validate(track_index=(0, None))
 async def get_track_volume(track_index: int) -> str:
     """
     Get the volume of a specific track.
@@ -534,18 +1355,17 @@ async def get_track_volume(track_index: int) -> str:
     Returns:
         The track volume (0.0 to 1.0)
     """
-    response = await ableton_client.send_osc('/live/track/get/volume', [track_index])
-    if response.get('status') == 'success':
-        data = response.get('data', ())
-        if len(data) >= 2:
-            return f"Track {track_index} volume: {data[1]:.2f}"
-        elif data:
-            return f"Track {track_index} volume: {data[0]:.2f}"
-        return f"Could not get volume for track {track_index}"
-    return format_response(response)
+    def on_success(data):
+        volume = _query_value(data)
+        if volume is None:
+            return f"Could not get volume for track {track_index}"
+        return f"Track {track_index} volume: {volume:.2f}"
+    
+    return await _dispatch('/live/track/get/volume', [track_index], on_success=on_success)
 
 
 @mcp.tool()
+@validate(track_index=(0, None), volume=(0.0, 1.0))
 async def set_track_volume(track_index: int, volume: float) -> str:
     """
     Set the volume of a specific track.
@@ -557,16 +1377,15 @@ async def set_track_volume(track_index: int, volume: float) -> str:
     Returns:
         Status message confirming the change
     """
-    if not 0.0 <= volume <= 1.0:
-        return "Error: Volume must be between 0.0 and 1.0"
-    
-    response = await ableton_client.send_osc('/live/track/set/volume', [track_index, volume])
-    if response.get('status') == 'sent':
-        return f"Track {track_index} volume set to {volume:.2f}"
-    return format_response(response)
+    return await _dispatch(
+        '/live/track/set/volume', [track_index, volume],
+        on_sent=f"Track {track_index} volume set to {volume:.2f}",
+        types='if'
+    )
 
 
 @mcp.tool()
+@validate(track_index=(0, None))
 async def get_track_mute(track_index: int) -> str:
     """
     Get the mute state of a specific track.
@@ -577,17 +1396,17 @@ async def get_track_mute(track_index: int) -> str:
     Returns:
         Whether the track is muted
     """
-    response = await ableton_client.send_osc('/live/track/get/mute', [track_index])
-    if response.get('status') == 'success':
-        data = response.get('data', ())
-        if len(data) >= 2:
-            muted = bool(data[1])
-            return f"Track {track_index} is {'muted' if muted else 'not muted'}"
-        return f"Could not get mute state for track {track_index}"
-    return format_response(response)
+    return await _dispatch(
+        '/live/track/get/mute', [track_index],
+        on_success=lambda data: (
+            f"Track {track_index} is {'muted' if data[1] else 'not muted'}" if len(data) >= 2
+            else f"Could not get mute state for track {track_index}"
+        )
+    )
 
 
 @mcp.tool()
+@validate(track_index=(0, None))
 async def set_track_mute(track_index: int, muted: bool) -> str:
     """
     Mute or unmute a specific track.
@@ -599,13 +1418,15 @@ async def set_track_mute(track_index: int, muted: bool) -> str:
     Returns:
         Status message confirming the change
     """
-    response = await ableton_client.send_osc('/live/track/set/mute', [track_index, int(muted)])
-    if response.get('status') == 'sent':
-        return f"Track {track_index} {'muted' if muted else 'unmuted'}"
-    return format_response(response)
+    return await _dispatch(
+        '/live/track/set/mute', [track_index, int(muted)],
+        on_sent=f"Track {track_index} {'muted' if muted else 'unmuted'}",
+        current='/live/track/get/mute'
+    )
 
 
 @mcp.tool()
+@validate(track_index=(0, None))
 async def get_track_solo(track_index: int) -> str:
     """
     Get the solo state of a specific track.
@@ -616,17 +1437,17 @@ async def get_track_solo(track_index: int) -> str:
     Returns:
         Whether the track is soloed
     """
-    response = await ableton_client.send_osc('/live/track/get/solo', [track_index])
-    if response.get('status') == 'success':
-        data = response.get('data', ())
-        if len(data) >= 2:
-            soloed = bool(data[1])
-            return f"Track {track_index} is {'soloed' if soloed else 'not soloed'}"
-        return f"Could not get solo state for track {track_index}"
-    return format_response(response)
+    return await _dispatch(
+        '/live/track/get/solo', [track_index],
+        on_success=lambda data: (
+            f"Track {track_index} is {'soloed' if data[1] else 'not soloed'}" if len(data) >= 2
+            else f"Could not get solo state for track {track_index}"
+        )
+    )
 
 
 @mcp.tool()
+@validate(track_index=(0, None))
 async def set_track_solo(track_index: int, soloed: bool) -> str:
     """
     Solo or unsolo a specific track.
@@ -638,13 +1459,15 @@ async def set_track_solo(track_index: int, soloed: bool) -> str:
     Returns:
         Status message confirming the change
     """
-    response = await ableton_client.send_osc('/live/track/set/solo', [track_index, int(soloed)])
-    if response.get('status') == 'sent':
-        return f"Track {track_index} {'soloed' if soloed else 'unsoloed'}"
-    return format_response(response)
+    return await _dispatch(
+        '/live/track/set/solo', [track_index, int(soloed)],
+        on_sent=f"Track {track_index} {'soloed' if soloed else 'unsoloed'}",
+        current='/live/track/get/solo'
+    )
 
 
 @mcp.tool()
+@validate(track_index=(0, None))
 async def get_track_arm(track_index: int) -> str:
     """
     Get the arm (record-enable) state of a specific track.
@@ -655,17 +1478,17 @@ async def get_track_arm(track_index: int) -> str:
     Returns:
         Whether the track is armed for recording
     """
-    response = await ableton_client.send_osc('/live/track/get/arm', [track_index])
-    if response.get('status') == 'success':
-        data = response.get('data', ())
-        if len(data) >= 2:
-            armed = bool(data[1])
-            return f"Track {track_index} is {'armed' if armed else 'not armed'}"
-        return f"Could not get arm state for track {track_index}"
-    return format_response(response)
+    return await _dispatch(
+        '/live/track/get/arm', [track_index],
+        on_success=lambda data: (
+            f"Track {track_index} is {'armed' if data[1] else 'not armed'}" if len(data) >= 2
+            else f"Could not get arm state for track {track_index}"
+        )
+    )
 
 
 @mcp.tool()
+@validate(track_index=(0, None))
 async def set_track_arm(track_index: int, armed: bool) -> str:
     """
     Arm or disarm a specific track for recording.
@@ -677,10 +1500,102 @@ async def set_track_arm(track_index: int, armed: bool) -> str:
     Returns:
         Status message confirming the change
     """
-    response = await ableton_client.send_osc('/live/track/set/arm', [track_index, int(armed)])
-    if response.get('status') == 'sent':
-        return f"Track {track_index} {'armed' if armed else 'disarmed'}"
-    return format_response(response)
+    return await _dispatch(
+        '/live/track/set/arm', [track_index, int(armed)],
+        on_sent=f"Track {track_index} {'armed' if armed else 'disarmed'}",
+        current='/live/track/get/arm'
+    )
+
+
+@mcp.tool()
+async def get_track_states(track_indices: List[int]) -> str:
+    """
+    Get the name, volume, mute, solo and arm state of several tracks at once.
+    
+    Args:
+        track_indices: The indices of the tracks to query (0-based)
+    
+    Returns:
+        The mixer state of each requested track
+    """
+    if not track_indices:
+        return "No tracks requested"
+    
+    properties = ('name', 'volume', 'mute', 'solo', 'arm')
+    responses = await ableton_client.send_batch([
+        (f'/live/track/get/{prop}', [track_index])
+        for track_index in track_indices
+        for prop in properties
+    ])
+    
+    lines = ["Tracks:"]
+    for position, track_index in enumerate(track_indices):
+        state = {}
+        track_responses = responses[position * len(properties):]
+        for prop, response in zip(properties, track_responses):
+            data = response.get('data', ()) if response.get('status') == 'success' else ()
+            if len(data) >= 2:  # Returns [track_index, value]
+                state[prop] = data[1]
+        
+        if 'name' not in state:
+            lines.append(f"  [{track_index}] Could not get track state")
+            continue
+        
+        volume = f"{state['volume']:.2f}" if 'volume' in state else "N/A"
+        lines.append(
+            f"  [{track_index}] {state['name']}: volume {volume}, "
+            f"{'muted' if state.get('mute') else 'not muted'}, "
+            f"{'soloed' if state.get('solo') else 'not soloed'}, "
+            f"{'armed' if state.get('arm') else 'not armed'}"
+        )
+    
+    return "\n".join(lines)
+
+
+@mcp.tool()
+async def get_track_levels_batch(track_indices: List[int]) -> str:
+    """
+    Get the current output meter levels of several tracks in one shot.
+    
+    Levels are read from the daemon's shared memory telemetry buffer rather
+    than queried from Ableton. Requires osc_daemon.py to run with
+    --telemetry-path and ABLETON_TELEMETRY_PATH to name the same file.
+    
+    Args:
+        track_indices: The indices of the tracks to read (0-based)
+    
+    Returns:
+        The latest output level of each requested track
+    """
+    if not track_indices:
+        return "No tracks requested"
+    
+    levels = ableton_client.read_track_levels()
+    if levels is None:
+        return ("Track level telemetry is not available. Start osc_daemon.py with "
+                "--telemetry-path and set ABLETON_TELEMETRY_PATH to the same file.")
+    
+    # Ask Ableton to stream meter levels for tracks not yet being metered
+    new_tracks = [i for i in dict.fromkeys(track_indices) if i not in ableton_client.metered_tracks]
+    if new_tracks:
+        responses = await ableton_client.send_batch([
+            ('/live/track/start_listen/output_meter_level', [track_index])
+            for track_index in new_tracks
+        ])
+        for track_index, response in zip(new_tracks, responses):
+            if response.get('status') in ('success', 'sent'):
+                ableton_client.metered_tracks.add(track_index)
+    
+    now = time.time()
+    lines = ["Track levels:"]
+    for track_index in track_indices:
+        if track_index in levels:
+            timestamp, level = levels[track_index]
+            lines.append(f"  [{track_index}] {level:.3f} ({(now - timestamp) * 1000:.0f} ms ago)")
+        else:
+            lines.append(f"  [{track_index}] No level received yet")
+    
+    return "\n".join(lines)
 
 
 @mcp.tool()
@@ -694,8 +1609,7 @@ async def create_midi_track(index: int = -1) -> str:
     Returns:
         Status message
     """
-    response = await ableton_client.send_osc('/live/song/create_midi_track', [index])
-    return format_response(response)
+    return await _dispatch('/live/song/create_midi_track', [index])
 
 
 @mcp.tool()
@@ -709,11 +1623,11 @@ async def create_audio_track(index: int = -1) -> str:
     Returns:
         Status message
     """
-    response = await ableton_client.send_osc('/live/song/create_audio_track', [index])
-    return format_response(response)
+    return await _dispatch('/live/song/create_audio_track', [index])
 
 
 @mcp.tool()
+@validate(track_index=(0, None))
 async def delete_track(track_index: int) -> str:
     """
     Delete a track from Ableton Live.
@@ -724,8 +1638,7 @@ async def delete_track(track_index: int) -> str:
     Returns:
         Status message
     """
-    response = await ableton_client.send_osc('/live/song/delete_track', [track_index])
-    return format_response(response)
+    return await _dispatch('/live/song/delete_track', [track_index])
 
 
 # =============================================================================
@@ -733,6 +1646,7 @@ async def delete_track(track_index: int) -> str:
 # =============================================================================
 
 @mcp.tool()
+@validate(track_index=(0, None))
 async def get_track_devices(track_index: int) -> str:
     """
     Get the list of devices on a specific track.
@@ -756,21 +1670,26 @@ async def get_track_devices(track_index: int) -> str:
     if num_devices == 0:
         return f"Track {track_index} has no devices"
     
-    # Get device names
-    result = f"Track {track_index} devices ({num_devices}):\n"
-    for device_index in range(num_devices):
-        name_response = await ableton_client.send_osc('/live/device/get/name', [track_index, device_index])
+    # Query all device names in a single round-trip to the daemon
+    name_responses = await ableton_client.send_batch([
+        ('/live/device/get/name', [track_index, device_index])
+        for device_index in range(num_devices)
+    ])
+    
+    lines = [f"Track {track_index} devices ({num_devices}):"]
+    for device_index, name_response in enumerate(name_responses):
         if name_response.get('status') == 'success':
             device_data = name_response.get('data', ())
             if len(device_data) >= 3:
-                result += f"  [{device_index}] {device_data[2]}\n"
+                lines.append(f"  [{device_index}] {device_data[2]}")
             elif device_data:
-                result += f"  [{device_index}] {device_data[-1]}\n"
+                lines.append(f"  [{device_index}] {device_data[-1]}")
     
-    return result.strip()
+    return "\n".join(lines)
 
 
 @mcp.tool()
+@validate(track_index=(0, None), device_index=(0, None))
 async def get_device_parameters(track_index: int, device_index: int) -> str:
     """
     Get the parameters of a specific device.
@@ -782,8 +1701,11 @@ async def get_device_parameters(track_index: int, device_index: int) -> str:
     Returns:
         List of parameter names and values
     """
-    # Get parameter names
-    names_response = await ableton_client.send_osc('/live/device/get/parameters/name', [track_index, device_index])
+    # Parameter names and values are independent queries, so batch them
+    names_response, values_response = await ableton_client.send_batch([
+        ('/live/device/get/parameters/name', [track_index, device_index]),
+        ('/live/device/get/parameters/value', [track_index, device_index])
+    ])
     if names_response.get('status') != 'success':
         return format_response(names_response)
     
@@ -794,26 +1716,25 @@ async def get_device_parameters(track_index: int, device_index: int) -> str:
     # Skip track_index and device_index in response
     param_names = names_data[2:]
     
-    # Get parameter values
-    values_response = await ableton_client.send_osc('/live/device/get/parameters/value', [track_index, device_index])
     param_values = []
     if values_response.get('status') == 'success':
         values_data = values_response.get('data', ())
         if len(values_data) >= 3:
             param_values = values_data[2:]
     
-    result = f"Device {device_index} on Track {track_index} parameters:\n"
+    lines = [f"Device {device_index} on Track {track_index} parameters:"]
     for i, name in enumerate(param_names):
         value = param_values[i] if i < len(param_values) else "N/A"
         if isinstance(value, float):
-            result += f"  [{i}] {name}: {value:.3f}\n"
+            lines.append(f"  [{i}] {name}: {value:.3f}")
         else:
-            result += f"  [{i}] {name}: {value}\n"
+            lines.append(f"  [{i}] {name}: {value}")
     
-    return result.strip()
+    return "\n".join(lines)
 
 
 @mcp.tool()
+@validate(track_index=(0, None), device_index=(0, None), param_index=(0, None))
 async def set_device_parameter(track_index: int, device_index: int, param_index: int, value: float) -> str:
     """
     Set a parameter value on a specific device.
@@ -827,13 +1748,12 @@ async def set_device_parameter(track_index: int, device_index: int, param_index:
     Returns:
         Status message confirming the change
     """
-    response = await ableton_client.send_osc(
+    return await _dispatch(
         '/live/device/set/parameter/value',
-        [track_index, device_index, param_index, value]
+        [track_index, device_index, param_index, value],
+        on_sent=f"Parameter {param_index} on device {device_index} (track {track_index}) set to {value}",
+        types='iiif'
     )
-    if response.get('status') == 'sent':
-        return f"Parameter {param_index} on device {device_index} (track {track_index}) set to {value}"
-    return format_response(response)
 
 
 # =============================================================================
@@ -848,16 +1768,14 @@ async def get_num_scenes() -> str:
     Returns:
         The number of scenes
     """
-    response = await ableton_client.send_osc('/live/song/get/num_scenes')
-    if response.get('status') == 'success':
-        data = response.get('data', ())
-        if data:
-            return f"Number of scenes: {data[0]}"
-        return "Could not retrieve scene count"
-    return format_response(response)
+    return await _dispatch(
+        '/live/song/get/num_scenes',
+        on_success=lambda data: f"Number of scenes: {data[0]}" if data else "Could not retrieve scene count"
+    )
 
 
 @mcp.tool()
+@validate(scene_index=(0, None))
 async def fire_scene(scene_index: int) -> str:
     """
     Fire (trigger) a specific scene.
@@ -868,13 +1786,11 @@ async def fire_scene(scene_index: int) -> str:
     Returns:
         Status message
     """
-    response = await ableton_client.send_osc('/live/scene/fire', [scene_index])
-    if response.get('status') == 'sent':
-        return f"Scene {scene_index} fired"
-    return format_response(response)
+    return await _dispatch('/live/scene/fire', [scene_index], on_sent=f"Scene {scene_index} fired")
 
 
 @mcp.tool()
+@validate(scene_index=(0, None))
 async def get_scene_name(scene_index: int) -> str:
     """
     Get the name of a specific scene.
@@ -885,18 +1801,17 @@ async def get_scene_name(scene_index: int) -> str:
     Returns:
         The scene name
     """
-    response = await ableton_client.send_osc('/live/scene/get/name', [scene_index])
-    if response.get('status') == 'success':
-        data = response.get('data', ())
-        if len(data) >= 2:
-            return f"Scene {scene_index}: {data[1]}"
-        elif data:
-            return f"Scene {scene_index}: {data[0]}"
-        return f"Could not get name for scene {scene_index}"
-    return format_response(response)
+    def on_success(data):
+        name = _query_value(data)
+        if name is None:
+            return f"Could not get name for scene {scene_index}"
+        return f"Scene {scene_index}: {name}"
+    
+    return await _dispatch('/live/scene/get/name', [scene_index], on_success=on_success)
 
 
 @mcp.tool()
+@validate(scene_index=(0, None))
 async def set_scene_name(scene_index: int, name: str) -> str:
     """
     Set the name of a specific scene.
@@ -908,10 +1823,10 @@ async def set_scene_name(scene_index: int, name: str) -> str:
     Returns:
         Status message confirming the change
     """
-    response = await ableton_client.send_osc('/live/scene/set/name', [scene_index, name])
-    if response.get('status') == 'sent':
-        return f"Scene {scene_index} renamed to '{name}'"
-    return format_response(response)
+    return await _dispatch(
+        '/live/scene/set/name', [scene_index, name],
+        on_sent=f"Scene {scene_index} renamed to '{name}'"
+    )
 
 
 @mcp.tool()
@@ -925,11 +1840,11 @@ async def create_scene(index: int = -1) -> str:
     Returns:
         Status message
     """
-    response = await ableton_client.send_osc('/live/song/create_scene', [index])
-    return format_response(response)
+    return await _dispatch('/live/song/create_scene', [index])
 
 
 @mcp.tool()
+@validate(scene_index=(0, None))
 async def delete_scene(scene_index: int) -> str:
     """
     Delete a scene from Ableton Live.
@@ -940,8 +1855,7 @@ async def delete_scene(scene_index: int) -> str:
     Returns:
         Status message
     """
-    response = await ableton_client.send_osc('/live/song/delete_scene', [scene_index])
-    return format_response(response)
+    return await _dispatch('/live/song/delete_scene', [scene_index])
 
 
 # =============================================================================
@@ -949,6 +1863,7 @@ async def delete_scene(scene_index: int) -> str:
 # =============================================================================
 
 @mcp.tool()
+@validate(track_index=(0, None), clip_index=(0, None))
 async def fire_clip(track_index: int, clip_index: int) -> str:
     """
     Fire (trigger) a specific clip.
@@ -960,13 +1875,14 @@ async def fire_clip(track_index: int, clip_index: int) -> str:
     Returns:
         Status message
     """
-    response = await ableton_client.send_osc('/live/clip/fire', [track_index, clip_index])
-    if response.get('status') == 'sent':
-        return f"Clip at track {track_index}, slot {clip_index} fired"
-    return format_response(response)
+    return await _dispatch(
+        '/live/clip/fire', [track_index, clip_index],
+        on_sent=f"Clip at track {track_index}, slot {clip_index} fired"
+    )
 
 
 @mcp.tool()
+@validate(track_index=(0, None), clip_index=(0, None))
 async def stop_clip(track_index: int, clip_index: int) -> str:
     """
     Stop a specific clip.
@@ -978,13 +1894,14 @@ async def stop_clip(track_index: int, clip_index: int) -> str:
     Returns:
         Status message
     """
-    response = await ableton_client.send_osc('/live/clip/stop', [track_index, clip_index])
-    if response.get('status') == 'sent':
-        return f"Clip at track {track_index}, slot {clip_index} stopped"
-    return format_response(response)
+    return await _dispatch(
+        '/live/clip/stop', [track_index, clip_index],
+        on_sent=f"Clip at track {track_index}, slot {clip_index} stopped"
+    )
 
 
 @mcp.tool()
+@validate(track_index=(0, None), clip_index=(0, None))
 async def get_clip_name(track_index: int, clip_index: int) -> str:
     """
     Get the name of a specific clip.
@@ -996,16 +1913,48 @@ async def get_clip_name(track_index: int, clip_index: int) -> str:
     Returns:
         The clip name
     """
-    response = await ableton_client.send_osc('/live/clip/get/name', [track_index, clip_index])
-    if response.get('status') == 'success':
-        data = response.get('data', ())
-        if len(data) >= 3:
-            return f"Clip at track {track_index}, slot {clip_index}: {data[2]}"
-        return f"Could not get clip name"
-    return format_response(response)
+    return await _dispatch(
+        '/live/clip/get/name', [track_index, clip_index],
+        on_success=lambda data: (
+            f"Clip at track {track_index}, slot {clip_index}: {data[2]}" if len(data) >= 3
+            else "Could not get clip name"
+        )
+    )
 
 
 @mcp.tool()
+@validate(track_index=(0, None))
+async def get_clip_names(track_index: int, clip_indices: List[int]) -> str:
+    """
+    Get the names of several clips on a track at once.
+    
+    Args:
+        track_index: The index of the track (0-based)
+        clip_indices: The indices of the clip slots to query (0-based)
+    
+    Returns:
+        The name of each requested clip
+    """
+    if not clip_indices:
+        return "No clips requested"
+    
+    responses = await ableton_client.send_batch([
+        ('/live/clip/get/name', [track_index, clip_index]) for clip_index in clip_indices
+    ])
+    
+    lines = [f"Clips on track {track_index}:"]
+    for clip_index, response in zip(clip_indices, responses):
+        data = response.get('data', ()) if response.get('status') == 'success' else ()
+        if len(data) >= 3:  # Returns [track_index, clip_index, name]
+            lines.append(f"  [{clip_index}] {data[2]}")
+        else:
+            lines.append(f"  [{clip_index}] Could not get clip name")
+    
+    return "\n".join(lines)
+
+
+@mcp.tool()
+@validate(track_index=(0, None), clip_index=(0, None))
 async def set_clip_name(track_index: int, clip_index: int, name: str) -> str:
     """
     Set the name of a specific clip.
@@ -1018,10 +1967,10 @@ async def set_clip_name(track_index: int, clip_index: int, name: str) -> str:
     Returns:
         Status message confirming the change
     """
-    response = await ableton_client.send_osc('/live/clip/set/name', [track_index, clip_index, name])
-    if response.get('status') == 'sent':
-        return f"Clip at track {track_index}, slot {clip_index} renamed to '{name}'"
-    return format_response(response)
+    return await _dispatch(
+        '/live/clip/set/name', [track_index, clip_index, name],
+        on_sent=f"Clip at track {track_index}, slot {clip_index} renamed to '{name}'"
+    )
 
 
 # =============================================================================
@@ -1036,16 +1985,14 @@ async def get_selected_track() -> str:
     Returns:
         The index of the selected track
     """
-    response = await ableton_client.send_osc('/live/view/get/selected_track')
-    if response.get('status') == 'success':
-        data = response.get('data', ())
-        if data:
-            return f"Selected track index: {data[0]}"
-        return "Could not determine selected track"
-    return format_response(response)
+    return await _dispatch(
+        '/live/view/get/selected_track',
+        on_success=lambda data: f"Selected track index: {data[0]}" if data else "Could not determine selected track"
+    )
 
 
 @mcp.tool()
+@validate(track_index=(0, None))
 async def set_selected_track(track_index: int) -> str:
     """
     Select a specific track.
@@ -1056,10 +2003,10 @@ async def set_selected_track(track_index: int) -> str:
     Returns:
         Status message confirming the selection
     """
-    response = await ableton_client.send_osc('/live/view/set/selected_track', [track_index])
-    if response.get('status') == 'sent':
-        return f"Track {track_index} selected"
-    return format_response(response)
+    return await _dispatch(
+        '/live/view/set/selected_track', [track_index],
+        on_sent=f"Track {track_index} selected"
+    )
 
 
 @mcp.tool()
@@ -1070,16 +2017,14 @@ async def get_selected_scene() -> str:
     Returns:
         The index of the selected scene
     """
-    response = await ableton_client.send_osc('/live/view/get/selected_scene')
-    if response.get('status') == 'success':
-        data = response.get('data', ())
-        if data:
-            return f"Selected scene index: {data[0]}"
-        return "Could not determine selected scene"
-    return format_response(response)
+    return await _dispatch(
+        '/live/view/get/selected_scene',
+        on_success=lambda data: f"Selected scene index: {data[0]}" if data else "Could not determine selected scene"
+    )
 
 
 @mcp.tool()
+@validate(scene_index=(0, None))
 async def set_selected_scene(scene_index: int) -> str:
     """
     Select a specific scene.
@@ -1090,10 +2035,10 @@ async def set_selected_scene(scene_index: int) -> str:
     Returns:
         Status message confirming the selection
     """
-    response = await ableton_client.send_osc('/live/view/set/selected_scene', [scene_index])
-    if response.get('status') == 'sent':
-        return f"Scene {scene_index} selected"
-    return format_response(response)
+    return await _dispatch(
+        '/live/view/set/selected_scene', [scene_index],
+        on_sent=f"Scene {scene_index} selected"
+    )
 
 
 # =============================================================================
@@ -1108,13 +2053,13 @@ async def get_application_version() -> str:
     Returns:
         The Ableton Live version string
     """
-    response = await ableton_client.send_osc('/live/application/get/version')
-    if response.get('status') == 'success':
-        data = response.get('data', ())
-        if data:
-            return f"Ableton Live version: {'.'.join(str(x) for x in data)}"
-        return "Could not retrieve version"
-    return format_response(response)
+    return await _dispatch(
+        '/live/application/get/version',
+        on_success=lambda data: (
+            f"Ableton Live version: {'.'.join(str(x) for x in data)}" if data
+            else "Could not retrieve version"
+        )
+    )
 
 
 @mcp.tool()
@@ -1166,7 +2111,7 @@ async def get_daemon_status() -> str:
 
 if __name__ == "__main__":
     logger.info("Starting Ableton Live MCP Server")
-    logger.info(f"Connecting to OSC daemon at {daemon_host}:{daemon_port}")
+    logger.info(f"Connecting to OSC daemon at {ableton_client.endpoint}")
     
     try:
         mcp.run()
@@ -1176,4 +2121,4 @@ if __name__ == "__main__":
         logger.error(f"Server error: {e}")
         sys.exit(1)
     finally:
-        ableton_client.disconnect()
+        ableton_client.close()
@@ -9,18 +9,35 @@ Default ports:
 - Socket server (MCP communication): 65432
 - Ableton OSC receive: 11000
 - Ableton OSC send: 11001
+
+Socket protocol:
+Each request and response is a JSON object preceded by its length as a
+4-byte big-endian unsigned integer. When msgpack is installed, requests may
+be msgpack maps instead, and are answered in msgpack. Requests may carry an 'id' field which
+is echoed back in the matching response, so clients can keep several
+requests in flight on one connection. Clients that send bare JSON objects
+without a length prefix (the original protocol) are still served.
+Hot fire-and-forget messages may instead be sent as compact binary frames
+(see FAST_SEND) using address ids from the 'intern_addresses' command.
 """
 
 import asyncio
+import functools
 import json
 import logging
+import mmap
 import signal
+import socket
+import struct
 import sys
 import os
-from typing import Dict, Any, Optional, Tuple
-from pythonosc.udp_client import SimpleUDPClient
-from pythonosc.osc_server import AsyncIOOSCUDPServer
-from pythonosc.dispatcher import Dispatcher
+import time
+from collections import defaultdict, deque
+from typing import Callable, Deque, Dict, Any, List, Optional, Tuple
+from pythonosc.osc_bundle_builder import IMMEDIATELY
+from pythonosc.osc_message_builder import OscMessageBuilder
+from pythonosc.parsing import osc_types
+from pythonosc.osc_packet import OscPacket, ParseError
 
 # Configure logging
 logging.basicConfig(
@@ -30,31 +47,188 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for the socket protocol when it is installed: it encodes
+# straight to bytes and is several times faster than the stdlib codec
+try:
+    import orjson
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj: Any) -> bytes:
+        # Non-ASCII characters are escaped, so the output is always ASCII
+        return json.dumps(obj, separators=(',', ':')).encode('ascii')
+    json_loads = json.loads
+
+# msgpack is optional too: clients that find it in MSGPACK_CODECS may send
+# msgpack frames instead of JSON, and get msgpack responses back
+try:
+    import msgpack
+    MSGPACK_CODECS = ['json', 'msgpack']
+except ImportError:
+    msgpack = None
+    MSGPACK_CODECS = ['json']
+
+# Length prefix preceding every message on the socket protocol
+FRAME_HEADER = struct.Struct('>I')
+
+# Compact binary send_message frame, sent instead of JSON for hot
+# fire-and-forget addresses: the FAST_SEND byte, the id the address was
+# interned under, the argument count, one struct format character per
+# argument ('i' for int32, 'f' for float32), then the little-endian values.
+# No response is sent.
+FAST_SEND = 0x01
+FAST_HEADER = struct.Struct('<BHB')
+
+# Telemetry ring buffer layout, shared with the MCP server: a 32-byte header
+# holding the number of records ever written, then fixed-size records of
+# (timestamp, track index, output meter level)
+TELEMETRY_HEADER = struct.Struct('<Q24x')
+TELEMETRY_RECORD = struct.Struct('<dIf16x')
+TELEMETRY_CAPACITY = 4096
+TELEMETRY_ADDRESS = '/live/track/get/output_meter_level'
+
+# Messages sent the most, whose templates are built when the daemon starts:
+# (address, argument type tags)
+HOT_MESSAGES = (
+    ('/live/clip/fire', 'ii'),
+    ('/live/clip/stop', 'ii'),
+    ('/live/clip_slot/fire', 'ii'),
+    ('/live/view/set/selected_track', 'i'),
+    ('/live/view/set/selected_scene', 'i'),
+    ('/live/track/set/volume', 'if'),
+    ('/live/device/set/parameter/value', 'iiif')
+)
+
+# OSC bundles sent to Ableton: the '#bundle' tag and an immediate time tag,
+# then each element's datagram preceded by its size
+OSC_BUNDLE_PREFIX = osc_types.write_string('#bundle') + osc_types.write_date(IMMEDIATELY)
+OSC_ELEMENT_SIZE = struct.Struct('>i')
+
+# OSC address prefixes that expect responses from Ableton
+_RESPONSE_PREFIXES = (
+    '/live/device/get',
+    '/live/scene/get',
+    '/live/view/get',
+    '/live/clip/get',
+    '/live/clip_slot/get',
+    '/live/track/get',
+    '/live/song/get',
+    '/live/api/get',
+    '/live/application/get',
+    '/live/test',
+    '/live/error'
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _address_expects_response(address: str) -> bool:
+    """
+    Determine if an OSC address expects a response from Ableton.
+    
+    Clients send the same handful of addresses over and over, so the
+    result is memoized per address.
+    
+    Args:
+        address: The OSC address to check
+        
+    Returns:
+        True if the address expects a response
+    """
+    return address.startswith(_RESPONSE_PREFIXES)
+
+
+# How many leading query arguments AbletonOSC echoes at the start of its
+# reply, per address scope: the indices of the object queried. Song, view
+# and application queries echo nothing; further arguments (e.g. the pitch
+# range of get/notes, or the range of song/get/track_names) are not echoed.
+_ECHOED_ARGUMENTS = (
+    ('/live/device/get/parameter/', 3),
+    ('/live/device/', 2),
+    ('/live/clip_slot/', 2),
+    ('/live/clip/', 2),
+    ('/live/track/', 1),
+    ('/live/scene/', 1),
+    ('/live/song/', 0),
+    ('/live/view/', 0),
+    ('/live/application/', 0),
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _echoed_argument_count(address: str) -> Optional[int]:
+    """Return how many arguments Ableton echoes in replies to address, or None if unknown."""
+    for prefix, count in _ECHOED_ARGUMENTS:
+        if address.startswith(prefix):
+            return count
+    return None
+
+
+def _reply_key(address: str, args: Any) -> tuple:
+    """Return the leading arguments a reply to a query must start with."""
+    if not isinstance(args, (list, tuple)):
+        args = (args,)
+    count = _echoed_argument_count(address)
+    return tuple(args if count is None else args[:count])
+
+
+class _OscReceiveProtocol(asyncio.DatagramProtocol):
+    """Passes each datagram received from Ableton to a packet handler."""
+    
+    def __init__(self, handle_packet: Callable[[bytes], None]):
+        self.handle_packet = handle_packet
+    
+    def datagram_received(self, data: bytes, addr: Any) -> None:
+        self.handle_packet(data)
+
 
 class AbletonOSCDaemon:
     """
     OSC Daemon that bridges MCP server communication with Ableton Live.
     
     The daemon:
-    1. Listens for TCP connections from the MCP server on socket_port
+    1. Listens for connections from the MCP server on socket_port (or socket_path)
     2. Sends OSC messages to Ableton Live on ableton_port
     3. Receives OSC responses from Ableton Live on receive_port
     """
     
-    # OSC address prefixes that expect responses from Ableton
-    RESPONSE_PREFIXES = (
-        '/live/device/get',
-        '/live/scene/get',
-        '/live/view/get',
-        '/live/clip/get',
-        '/live/clip_slot/get',
-        '/live/track/get',
-        '/live/song/get',
-        '/live/api/get',
-        '/live/application/get',
-        '/live/test',
-        '/live/error'
-    )
+    # Fire-and-forget messages are held back this many seconds so that a
+    # burst of them goes out as one OSC bundle, of at most MAX_BUNDLE_BYTES
+    BUNDLE_DELAY = 0.002
+    MAX_BUNDLE_BYTES = 8192
+    
+    # Send buffer requested for the UDP socket to Ableton, so bursts of
+    # messages rarely have to wait for it to drain
+    SEND_BUFFER_SIZE = 1 << 20
+    
+    # Bytes of unsent responses to a client above which the daemon waits
+    # for the socket to catch up before writing more
+    DRAIN_THRESHOLD = 64 * 1024
+    
+    # Most datagrams read from Ableton per wakeup, so that a burst of
+    # listener updates can't starve the socket server
+    RECEIVE_BATCH = 64
+    
+    # Upper bound on cached message encodings, as addresses come from clients
+    MAX_MESSAGE_TEMPLATES = 1024
+    
+    # Seconds a forwarded query may take beyond the response timeout, which
+    # the first worker applies itself, before it is given up
+    FORWARD_TIMEOUT_MARGIN = 1.0
+    
+    # Seconds a query response is served from the cache, so that several
+    # clients asking for the same property share one trip to Ableton.
+    # Fire-and-forget messages drop the entries they may have changed.
+    RESPONSE_CACHE_TTL = 0.25
+    MAX_RESPONSE_CACHE_ENTRIES = 1024
+    
+    # Address scopes whose first argument is a track index
+    TRACK_DOMAINS = ('track', 'device', 'clip', 'clip_slot')
+    
+    # Properties that change continuously and are never cached
+    UNCACHED_PROPERTIES = frozenset((
+        'current_song_time', 'playing_position',
+        'output_meter_level', 'output_meter_left', 'output_meter_right'
+    ))
     
     def __init__(self, 
                  socket_host: str = '127.0.0.1',
@@ -62,7 +236,12 @@ class AbletonOSCDaemon:
                  ableton_host: str = '127.0.0.1',
                  ableton_port: int = 11000,
                  receive_port: int = 11001,
-                 response_timeout: float = 5.0):
+                 response_timeout: float = 5.0,
+                 socket_path: Optional[str] = None,
+                 telemetry_path: Optional[str] = None,
+                 reuse_port: bool = False,
+                 forward_sock: Optional[socket.socket] = None,
+                 worker_socks: Optional[List[socket.socket]] = None):
         """
         Initialize the OSC daemon.
         
@@ -73,33 +252,103 @@ class AbletonOSCDaemon:
             ableton_port: Port where Ableton Live receives OSC messages
             receive_port: Port where this daemon receives OSC responses
             response_timeout: Timeout in seconds for waiting for OSC responses
+            socket_path: Unix domain socket path for MCP server connections;
+                replaces the TCP socket server when given
+            telemetry_path: File to publish track meter levels to as a
+                shared memory ring buffer (e.g. /dev/shm/ableton-telemetry)
+            reuse_port: Bind the TCP socket server with SO_REUSEPORT, so that
+                several daemon processes can share socket_port
+            forward_sock: Connected stream socket to the first worker; when
+                given, this daemon doesn't receive OSC itself and forwards
+                its queries there instead
+            worker_socks: Connected stream sockets from the other workers,
+                served like client connections
         """
         self.socket_host = socket_host
         self.socket_port = socket_port
+        self.socket_path = socket_path
+        self.socket_endpoint = socket_path or f"{socket_host}:{socket_port}"
         self.ableton_host = ableton_host
         self.ableton_port = ableton_port
         self.receive_port = receive_port
         self.response_timeout = response_timeout
+        self.telemetry_path = telemetry_path
+        self.reuse_port = reuse_port
+        self.forward_sock = forward_sock
+        self.worker_socks = worker_socks or []
+        
+        # Queries forwarded to the first worker, by request id
+        self._forward_writer: Optional[asyncio.StreamWriter] = None
+        self._forward_pending: Dict[int, asyncio.Future] = {}
+        self._forward_next_id = 0
+        self._forward_task: Optional[asyncio.Task] = None
+        # Writes whose cache invalidation the first worker hasn't been told
+        # about yet; sent once the writes themselves have gone to Ableton
+        self._forward_invalidations: List[Tuple[str, Any]] = []
+        self._worker_tasks: List[asyncio.Task] = []
+        
+        # Addresses interned for compact binary frames; the id is the index
+        self.interned_addresses: List[str] = []
+        self._address_ids: Dict[str, int] = {}
+        self._fast_structs: Dict[bytes, struct.Struct] = {}
+        self.telemetry: Optional[mmap.mmap] = None
+        self._telemetry_count = 0
+        
+        # UDP socket for sending messages to Ableton
+        family, _, _, _, self._ableton_address = socket.getaddrinfo(
+            ableton_host, ableton_port, type=socket.SOCK_DGRAM
+        )[0]
+        self._osc_sock = socket.socket(family, socket.SOCK_DGRAM)
+        try:
+            self._osc_sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SEND_BUFFER_SIZE)
+        except OSError:
+            pass  # keep the system default
+        # The Windows proactor loop has no add_writer, and a blocking UDP
+        # send there doesn't stall in practice
+        if sys.platform != 'win32':
+            self._osc_sock.setblocking(False)
+        # Datagrams waiting for the send buffer to drain, sent in order
+        self._send_queue: Deque[bytes] = deque()
         
-        # Initialize OSC client for sending messages to Ableton
-        self.osc_client = SimpleUDPClient(ableton_host, ableton_port)
+        # Encoded address and type tags, plus a struct packing them with the
+        # arguments, per (address, type tags) of int and float messages;
+        # the hottest are built up front
+        self._message_templates: Dict[Tuple[str, str], Tuple[bytes, struct.Struct]] = {}
+        for address, tags in HOT_MESSAGES:
+            self._message_template(address, tags)
         
-        # Store pending responses keyed by OSC address
-        # Using a dict with address as key and a list of futures to handle multiple requests
-        self.pending_responses: Dict[str, asyncio.Future] = {}
-        self._response_lock = asyncio.Lock()
+        # Shared responses to fire-and-forget messages, and their encodings
+        # up to the request id, per address
+        self._sent_responses: Dict[str, Dict[str, Any]] = {}
+        self._sent_prefixes: Dict[Tuple[str, bool], bytes] = {}
         
-        # Initialize OSC server dispatcher
-        self.dispatcher = Dispatcher()
-        self.dispatcher.set_default_handler(self._handle_ableton_message)
+        # Fire-and-forget datagrams waiting to be flushed as one bundle
+        self._pending_bundle: List[bytes] = []
+        self._pending_bundle_bytes = 0
+        self._bundle_flush: Optional[asyncio.TimerHandle] = None
         
-        # Server references
-        self.osc_server: Optional[AsyncIOOSCUDPServer] = None
+        # Query cache: (address, args) -> (expiry time, response). The
+        # generation is bumped whenever the cache is cleared, so that a query
+        # in flight during a write does not cache a stale result.
+        self._response_cache: Dict[Tuple[str, tuple], Tuple[float, Dict[str, Any]]] = {}
+        self._response_cache_generation = 0
+        
+        # Futures waiting for a response, queued per OSC address with the
+        # arguments the reply will echo (see _reply_key). Requests to the
+        # same address can be in flight at once; a reply resolves the oldest
+        # one it matches, so a lost or late reply can't shift the others.
+        self.pending_responses: Dict[str, Deque[Tuple[tuple, asyncio.Future]]] = defaultdict(deque)
+        
+        # Server references; OSC is received on receive_sock, or through
+        # a datagram transport where the event loop can't watch sockets
+        # (Windows)
+        self.osc_transport: Optional[asyncio.DatagramTransport] = None
+        self.receive_sock: Optional[socket.socket] = None
         self.tcp_server: Optional[asyncio.Server] = None
         self._running = False
         
         logger.info("OSC Daemon initialized")
-        logger.info(f"  Socket server: {socket_host}:{socket_port}")
+        logger.info(f"  Socket server: {self.socket_endpoint}")
         logger.info(f"  Ableton OSC send: {ableton_host}:{ableton_port}")
         logger.info(f"  Ableton OSC receive: {socket_host}:{receive_port}")
     
@@ -107,7 +356,7 @@ class AbletonOSCDaemon:
         """
         Handle incoming OSC messages from Ableton Live.
         
-        This method is called by the OSC server when a message is received.
+        This method is called for each message received from Ableton.
         It resolves any pending futures waiting for this address.
         
         Args:
@@ -116,55 +365,167 @@ class AbletonOSCDaemon:
         """
         logger.debug(f"Received OSC: {address} {args}")
         
-        # Check if there's a pending request for this address
-        if address in self.pending_responses:
-            future = self.pending_responses.get(address)
-            if future and not future.done():
-                future.set_result({
-                    'status': 'success',
-                    'address': address,
-                    'data': args
-                })
-                logger.debug(f"Resolved pending response for {address}")
-            # Clean up
-            if address in self.pending_responses:
-                del self.pending_responses[address]
-        else:
-            # Log unsolicited messages (could be listener notifications)
-            logger.debug(f"Unsolicited OSC message: {address} {args}")
+        if address == TELEMETRY_ADDRESS and self.telemetry is not None:
+            self._write_telemetry(args)
+        
+        # Check if there's a pending request for this address and arguments
+        futures = self.pending_responses.get(address)
+        if futures:
+            for entry in futures:
+                key, future = entry
+                if args[:len(key)] == key:
+                    futures.remove(entry)
+                    if not futures:
+                        del self.pending_responses[address]
+                    if not future.done():
+                        future.set_result({
+                            'status': 'success',
+                            'address': address,
+                            'data': args
+                        })
+                        logger.debug(f"Resolved pending response for {address}")
+                    return
+        
+        # Log unsolicited messages (could be listener notifications)
+        logger.debug(f"Unsolicited OSC message: {address} {args}")
+    
+    def _open_receive_socket(self) -> None:
+        """Bind the UDP socket for messages from Ableton and start watching it."""
+        family, _, _, _, address = socket.getaddrinfo(
+            self.socket_host, self.receive_port, type=socket.SOCK_DGRAM
+        )[0]
+        sock = socket.socket(family, socket.SOCK_DGRAM)
+        try:
+            sock.bind(address)
+            sock.setblocking(False)
+            asyncio.get_running_loop().add_reader(sock, self._drain_receive_socket)
+        except Exception:
+            sock.close()
+            raise
+        self.receive_sock = sock
+    
+    def _drain_receive_socket(self) -> None:
+        """
+        Dispatch the datagrams waiting on the receive socket.
+        
+        Reading until the socket would block handles a burst of replies in
+        one wakeup rather than one wakeup per datagram.
+        """
+        sock = self.receive_sock
+        for _ in range(self.RECEIVE_BATCH):
+            try:
+                data, client_address = sock.recvfrom(65536)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
+                logger.warning(f"Error receiving OSC message: {e}")
+                return
+            self._handle_packet(data)
+    
+    def _handle_packet(self, data: bytes) -> None:
+        """
+        Handle every message of an OSC packet received from Ableton.
+        
+        Args:
+            data: The datagram, a single message or a bundle
+        """
+        try:
+            messages = OscPacket(data).messages
+        except ParseError as e:
+            logger.warning(f"Malformed OSC packet: {e}")
+            return
+        for timed_message in messages:
+            message = timed_message.message
+            try:
+                self._handle_ableton_message(message.address, *message.params)
+            except Exception as e:
+                logger.error(f"Error handling OSC message: {e}")
+    
+    def _open_telemetry(self) -> None:
+        """Create the telemetry file and map it into memory."""
+        size = TELEMETRY_HEADER.size + TELEMETRY_CAPACITY * TELEMETRY_RECORD.size
+        fd = os.open(self.telemetry_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, size)
+            self.telemetry = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        self._telemetry_count = 0
     
-    async def _send_osc_with_response(self, address: str, args: list) -> Dict[str, Any]:
+    def _write_telemetry(self, args: tuple) -> None:
+        """
+        Append a meter level to the telemetry ring buffer.
+        
+        Args:
+            args: The OSC arguments, [track_index, level]
+        """
+        if len(args) < 2:
+            return
+        try:
+            track_index = int(args[0])
+            level = float(args[1])
+        except (TypeError, ValueError):
+            return
+        
+        count = self._telemetry_count
+        offset = TELEMETRY_HEADER.size + (count % TELEMETRY_CAPACITY) * TELEMETRY_RECORD.size
+        TELEMETRY_RECORD.pack_into(self.telemetry, offset, time.time(), track_index, level)
+        self._telemetry_count = count + 1
+        TELEMETRY_HEADER.pack_into(self.telemetry, 0, self._telemetry_count)
+    
+    async def _send_osc_with_response(self, address: str, args: list,
+                                      timeout: Any = None) -> Dict[str, Any]:
         """
         Send an OSC message and wait for a response.
         
         Args:
             address: The OSC address to send to
             args: The arguments to send
+            timeout: Seconds the requester will wait, if it said; used when
+                shorter than response_timeout
             
         Returns:
             A dictionary containing the response or error
         """
-        async with self._response_lock:
-            # Create a future for the response
-            future = asyncio.Future()
-            self.pending_responses[address] = future
+        if not isinstance(timeout, (int, float)) or not 0 < timeout < self.response_timeout:
+            timeout = self.response_timeout
+        
+        if self.forward_sock is not None:
+            # Send held back messages first, so that the query sees them
+            self._flush_bundle()
+            return await self._forward_query(address, args, timeout)
+        
+        key = self._response_cache_key(address, args)
+        if key is not None:
+            entry = self._response_cache.get(key)
+            if entry is not None and entry[0] >= time.monotonic():
+                logger.debug(f"Cached response for {address}")
+                return dict(entry[1])  # callers add their request id
+            generation = self._response_cache_generation
+        
+        # Create a future for the response, failed by a timer instead of
+        # wrapping the wait in wait_for
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        entry = (_reply_key(address, args), future)
+        self.pending_responses[address].append(entry)
+        timer = loop.call_later(timeout, self._expire_response, future)
         
         try:
-            # Send the OSC message
-            self.osc_client.send_message(address, args)
+            # Send the OSC message, after any held back messages so that
+            # the query sees their effect
+            self._flush_bundle()
+            self._send_datagram(self._encode_message(address, args))
             logger.debug(f"Sent OSC: {address} {args}")
             
-            # Wait for response with timeout
-            response = await asyncio.wait_for(future, timeout=self.response_timeout)
+            # Wait for the response, or the timer to expire
+            response = await future
             logger.debug(f"Got response for {address}: {response}")
-            return response
+            if key is not None and generation == self._response_cache_generation:
+                self._cache_response(key, response)
+            return dict(response)
             
         except asyncio.TimeoutError:
-            # Clean up the pending response
-            async with self._response_lock:
-                if address in self.pending_responses:
-                    del self.pending_responses[address]
-            
             error_msg = f"Timeout waiting for response to {address}"
             logger.warning(error_msg)
             return {
@@ -173,23 +534,317 @@ class AbletonOSCDaemon:
                 'address': address
             }
         except Exception as e:
-            # Clean up on any error
-            async with self._response_lock:
-                if address in self.pending_responses:
+            error_msg = f"Error sending OSC message: {str(e)}"
+            logger.error(error_msg)
+            return {
+                'status': 'error',
+                'message': error_msg,
+                'address': address
+            }
+        finally:
+            timer.cancel()
+            # Drop the future unless a response already dequeued it
+            futures = self.pending_responses.get(address)
+            if futures is not None:
+                try:
+                    futures.remove(entry)
+                except ValueError:
+                    pass
+                if not futures:
                     del self.pending_responses[address]
+    
+    async def _forward_query(self, address: str, args: list, timeout: float) -> Dict[str, Any]:
+        """
+        Have the first worker send a query and wait for its response.
+        
+        Ableton answers every query on the one receive port, which only the
+        first worker listens on.
+        
+        Args:
+            address: The OSC address to send to
+            args: The arguments to send
+            timeout: Seconds the first worker waits for Ableton
             
-            error_msg = f"Error sending OSC message: {str(e)}"
+        Returns:
+            A dictionary containing the response or error
+        """
+        if self._forward_writer is None:
+            return {
+                'status': 'error',
+                'message': 'Not connected to the first daemon worker',
+                'address': address
+            }
+        
+        self._forward_next_id += 1
+        request_id = self._forward_next_id
+        future = asyncio.get_running_loop().create_future()
+        self._forward_pending[request_id] = future
+        try:
+            body = json_dumps({
+                'command': 'send_message', 'id': request_id,
+                'address': address, 'args': args, 'timeout': timeout
+            })
+            self._forward_writer.write(FRAME_HEADER.pack(len(body)) + body)
+            return await asyncio.wait_for(
+                future, timeout + self.FORWARD_TIMEOUT_MARGIN
+            )
+        except asyncio.TimeoutError:
+            error_msg = f"Timeout waiting for response to {address}"
+            logger.warning(error_msg)
+            return {
+                'status': 'error',
+                'message': error_msg,
+                'address': address
+            }
+        except Exception as e:
+            error_msg = f"Error forwarding OSC message: {str(e)}"
             logger.error(error_msg)
             return {
                 'status': 'error',
                 'message': error_msg,
                 'address': address
             }
+        finally:
+            self._forward_pending.pop(request_id, None)
+    
+    async def _read_forwarded_responses(self, reader: asyncio.StreamReader) -> None:
+        """Resolve forwarded queries as the first worker answers them."""
+        try:
+            while True:
+                header = await reader.readexactly(FRAME_HEADER.size)
+                (length,) = FRAME_HEADER.unpack(header)
+                response = json_loads(await reader.readexactly(length))
+                future = self._forward_pending.pop(response.pop('id', None), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except (asyncio.IncompleteReadError, ConnectionError, OSError):
+            logger.error("Lost the connection to the first daemon worker")
+        finally:
+            self._forward_writer = None
+            pending, self._forward_pending = self._forward_pending, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_result({
+                        'status': 'error',
+                        'message': 'Lost the connection to the first daemon worker'
+                    })
+    
+    def _response_cache_key(self, address: str, args: Any) -> Optional[Tuple[str, tuple]]:
+        """Return the cache key of a query, or None if it isn't cached."""
+        scope, separator, prop = address.partition('/get/')
+        if not separator or not scope.startswith('/live/') or prop in self.UNCACHED_PROPERTIES:
+            return None
+        key = (address, tuple(args) if isinstance(args, list) else (args,))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def _cache_response(self, key: Tuple[str, tuple], response: Dict[str, Any]) -> None:
+        """Cache a query response for RESPONSE_CACHE_TTL."""
+        now = time.monotonic()
+        if len(self._response_cache) >= self.MAX_RESPONSE_CACHE_ENTRIES:
+            self._response_cache = {k: v for k, v in self._response_cache.items() if v[0] >= now}
+            if len(self._response_cache) >= self.MAX_RESPONSE_CACHE_ENTRIES:
+                self._response_cache.clear()
+        self._response_cache[key] = (now + self.RESPONSE_CACHE_TTL, response)
+    
+    def clear_cache(self) -> int:
+        """
+        Drop all cached query responses.
+        
+        Returns:
+            The number of responses dropped
+        """
+        self._response_cache_generation += 1
+        count = len(self._response_cache)
+        self._response_cache.clear()
+        return count
+    
+    def _invalidate_responses(self, address: str, args: Any) -> int:
+        """
+        Drop cached responses that a write to address may have changed.
+        
+        Writes to a track, or to its devices and clips, only drop entries
+        for that track plus song-level entries such as track_names. View
+        writes only drop view entries. Anything else clears the cache.
+        A worker forwarding its queries has the first worker do the same.
+        
+        Returns:
+            The number of responses dropped
+        """
+        if self.forward_sock is not None:
+            self._forward_invalidations.append((address, args))
+        
+        # Queries in flight during the write must not cache their result
+        self._response_cache_generation += 1
+        count = len(self._response_cache)
+        if not count:
+            return 0
+        
+        domain = address.split('/')[2] if address.count('/') >= 2 else ''
+        if domain in self.TRACK_DOMAINS and isinstance(args, list) and args:
+            track = args[0]
+            for key in list(self._response_cache):
+                key_domain = key[0].split('/')[2]
+                if key_domain == 'song' or (key_domain in self.TRACK_DOMAINS and key[1][:1] == (track,)):
+                    del self._response_cache[key]
+        elif domain == 'view':
+            for key in list(self._response_cache):
+                if key[0].startswith('/live/view/'):
+                    del self._response_cache[key]
+        else:
+            self._response_cache.clear()
+        return count - len(self._response_cache)
+    
+    def _send_forward_invalidations(self) -> None:
+        """Tell the first worker which cached responses this worker's writes changed."""
+        invalidations, self._forward_invalidations = self._forward_invalidations, []
+        if not invalidations or self._forward_writer is None:
+            return
+        frames = []
+        for address, args in invalidations:
+            try:
+                body = json_dumps({'command': 'clear_cache', 'address': address, 'args': args})
+            except TypeError:  # arguments JSON can't carry; drop everything
+                body = json_dumps({'command': 'clear_cache'})
+            frames.append(FRAME_HEADER.pack(len(body)) + body)
+        # Queries forwarded after this are answered after the invalidation
+        self._forward_writer.write(b''.join(frames))
+    
+    @staticmethod
+    def _expire_response(future: asyncio.Future) -> None:
+        """Fail a response future that is still waiting after response_timeout."""
+        if not future.done():
+            future.set_exception(asyncio.TimeoutError())
+    
+    def _encode_message(self, address: str, args: Any) -> bytes:
+        """
+        Encode an OSC message, taking a list of arguments or a single one.
+        
+        Messages whose arguments are all int32 and float values are packed
+        behind a cached encoding of the address and type tags; anything
+        else goes through OscMessageBuilder.
+        
+        Args:
+            address: The OSC address to send to
+            args: The arguments to send
+            
+        Returns:
+            The OSC datagram
+        """
+        if not isinstance(args, list):
+            args = [args]
+        
+        tags = ''
+        for arg in args:
+            # bool is an int subclass, but OSC encodes it as a type tag
+            arg_type = type(arg)
+            if arg_type is int and -0x80000000 <= arg <= 0x7FFFFFFF:
+                tags += 'i'
+            elif arg_type is float:
+                tags += 'f'
+            else:
+                builder = OscMessageBuilder(address)
+                for arg in args:
+                    builder.add_arg(arg)
+                return builder.build().dgram
+        
+        template = self._message_templates.get((address, tags))
+        if template is None:
+            template = self._message_template(address, tags)
+        prefix, message_struct = template
+        return message_struct.pack(prefix, *args)
+    
+    def _message_template(self, address: str, tags: str) -> Tuple[bytes, struct.Struct]:
+        """
+        Build, and cache while there is room, the template of a message.
+        
+        The struct packs the encoded address and type tags along with the
+        arguments, so a datagram is built in a single allocation.
+        
+        Args:
+            address: The OSC address
+            tags: The type tag of each argument, 'i' or 'f'
+            
+        Returns:
+            The encoded address and type tags, and the struct
+        """
+        if not address:
+            raise ValueError('OSC addresses cannot be empty')
+        prefix = osc_types.write_string(address) + osc_types.write_string(',' + tags)
+        template = (prefix, struct.Struct(f'>{len(prefix)}s{tags}'))
+        if len(self._message_templates) < self.MAX_MESSAGE_TEMPLATES:
+            self._message_templates[(address, tags)] = template
+        return template
+    
+    def _send_datagram(self, dgram: bytes) -> None:
+        """
+        Send a datagram to Ableton without blocking the event loop.
+        
+        When the socket's send buffer is full, the datagram is queued and
+        sent once the socket becomes writable again.
+        
+        Args:
+            dgram: The OSC message or bundle to send
+        """
+        if not self._send_queue:
+            try:
+                self._osc_sock.sendto(dgram, self._ableton_address)
+                return
+            except BlockingIOError:
+                asyncio.get_running_loop().add_writer(self._osc_sock, self._drain_send_queue)
+        self._send_queue.append(dgram)
+    
+    def _drain_send_queue(self) -> None:
+        """Send queued datagrams until the send buffer fills up again."""
+        queue = self._send_queue
+        while queue:
+            try:
+                self._osc_sock.sendto(queue[0], self._ableton_address)
+            except BlockingIOError:
+                return
+            except OSError as e:
+                logger.error(f"Error sending OSC messages: {str(e)}")
+            queue.popleft()
+        asyncio.get_running_loop().remove_writer(self._osc_sock)
+    
+    @staticmethod
+    def _encode_bundle(messages: List[bytes]) -> bytes:
+        """Encode OSC message datagrams as one immediate OSC bundle."""
+        return OSC_BUNDLE_PREFIX + b''.join(
+            OSC_ELEMENT_SIZE.pack(len(dgram)) + dgram for dgram in messages
+        )
+    
+    def _flush_bundle(self) -> None:
+        """Send the held back fire-and-forget messages to Ableton."""
+        if self._bundle_flush is not None:
+            self._bundle_flush.cancel()
+            self._bundle_flush = None
+        messages = self._pending_bundle
+        if not messages:
+            return
+        self._pending_bundle = []
+        self._pending_bundle_bytes = 0
+        
+        try:
+            if len(messages) == 1:
+                self._send_datagram(messages[0])
+            else:
+                self._send_datagram(self._encode_bundle(messages))
+            logger.debug(f"Flushed {len(messages)} fire-and-forget messages")
+        except Exception as e:
+            logger.error(f"Error sending OSC messages: {str(e)}")
+        self._send_forward_invalidations()
     
     def _send_osc_fire_and_forget(self, address: str, args: list) -> Dict[str, Any]:
         """
         Send an OSC message without waiting for a response.
         
+        The message is held back for BUNDLE_DELAY so that it can share a
+        bundle with other fire-and-forget messages sent in the meantime.
+        
         Args:
             address: The OSC address to send to
             args: The arguments to send
@@ -198,38 +853,179 @@ class AbletonOSCDaemon:
             A dictionary indicating the message was sent
         """
         try:
-            self.osc_client.send_message(address, args)
-            logger.debug(f"Sent OSC (fire-and-forget): {address} {args}")
+            dgram = self._encode_message(address, args)
+            self._invalidate_responses(address, args)
+            if self._pending_bundle_bytes + len(dgram) > self.MAX_BUNDLE_BYTES:
+                self._flush_bundle()
+            self._pending_bundle.append(dgram)
+            self._pending_bundle_bytes += len(dgram)
+            if self._bundle_flush is None:
+                self._bundle_flush = asyncio.get_running_loop().call_later(
+                    self.BUNDLE_DELAY, self._flush_bundle
+                )
+            logger.debug(f"Queued OSC (fire-and-forget): {address} {args}")
+            return self._sent_response(address)
+        except Exception as e:
+            error_msg = f"Error sending OSC message: {str(e)}"
+            logger.error(error_msg)
             return {
-                'status': 'sent',
+                'status': 'error',
+                'message': error_msg,
                 'address': address
             }
+    
+    def _sent_response(self, address: str) -> Dict[str, Any]:
+        """
+        Return the response for a fire-and-forget message to address.
+        
+        Responses are shared per address and must not be modified; the
+        framed protocol answers with a pre-encoded copy carrying the
+        request id (see _encode_sent_response).
+        """
+        response = self._sent_responses.get(address)
+        if response is None:
+            response = {'status': 'sent', 'address': address}
+            if len(self._sent_responses) < self.MAX_MESSAGE_TEMPLATES:
+                self._sent_responses[address] = response
+        return response
+    
+    def _encode_sent_response(self, address: str, request_id: Any, use_msgpack: bool) -> bytes:
+        """Encode the response for a fire-and-forget message, with its request id."""
+        prefix = self._sent_prefixes.get((address, use_msgpack))
+        if prefix is None:
+            if use_msgpack:
+                # A three-entry map; the id value goes last
+                prefix = b'\x83' + b''.join(map(msgpack.packb, ('status', 'sent', 'address', address, 'id')))
+            else:
+                prefix = json_dumps({'status': 'sent', 'address': address})[:-1] + b',"id":'
+            if len(self._sent_prefixes) < self.MAX_MESSAGE_TEMPLATES:
+                self._sent_prefixes[(address, use_msgpack)] = prefix
+        if use_msgpack:
+            return prefix + msgpack.packb(request_id)
+        return prefix + json_dumps(request_id) + b'}'
+    
+    def _send_osc_bundle(self, messages: List[Tuple[str, list]]) -> Dict[str, Any]:
+        """
+        Send several OSC messages to Ableton as a single OSC bundle.
+        
+        Args:
+            messages: The (address, args) pairs to send, in order
+            
+        Returns:
+            A dictionary indicating the bundle was sent, or that it was
+            rejected ('rejected' set) before any of it was sent
+        """
+        try:
+            bundle = self._encode_bundle([
+                self._encode_message(address, args) for address, args in messages
+            ])
+            # Keep messages held back for coalescing ahead of this bundle
+            self._flush_bundle()
+            for address, args in messages:
+                self._invalidate_responses(address, args)
+            self._send_datagram(bundle)
+            self._send_forward_invalidations()
+            logger.debug(f"Sent OSC bundle of {len(messages)} messages")
+            return {
+                'status': 'sent',
+                'count': len(messages)
+            }
         except Exception as e:
-            error_msg = f"Error sending OSC message: {str(e)}"
+            error_msg = f"Error sending OSC bundle: {str(e)}"
             logger.error(error_msg)
             return {
                 'status': 'error',
                 'message': error_msg,
-                'address': address
+                'rejected': True
             }
     
-    def _expects_response(self, address: str) -> bool:
+    def _send_queued_messages(self, queued: List[Tuple[int, str, list]],
+                              responses: List[Optional[Dict[str, Any]]]) -> None:
+        """
+        Send queued fire-and-forget messages of a batch and record their results.
+        
+        Args:
+            queued: The (position, address, args) triples to send
+            responses: The batch results, filled in at each message's position
+        """
+        if len(queued) == 1:
+            index, address, args = queued[0]
+            responses[index] = self._send_osc_fire_and_forget(address, args)
+        elif queued:
+            result = self._send_osc_bundle([(address, args) for _, address, args in queued])
+            for index, address, _ in queued:
+                if result['status'] == 'sent':
+                    responses[index] = self._sent_response(address)
+                else:
+                    responses[index] = {**result, 'address': address}
+    
+    async def _send_queued_queries(self, queries: List[Tuple[int, str, list]],
+                                   responses: List[Optional[Dict[str, Any]]]) -> None:
+        """
+        Send queued queries of a batch at once and record their responses.
+        
+        Args:
+            queries: The (position, address, args) triples to send
+            responses: The batch results, filled in at each message's position
+        """
+        results = await asyncio.gather(*(
+            self._send_osc_with_response(address, args) for _, address, args in queries
+        ))
+        for (index, _, _), result in zip(queries, results):
+            responses[index] = result
+    
+    async def _send_osc_batch(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
-        Determine if an OSC address expects a response from Ableton.
+        Send several OSC messages on behalf of a single request.
+        
+        Consecutive fire-and-forget messages are grouped into one OSC bundle,
+        and consecutive messages expecting a response are sent together and
+        awaited concurrently. Ordering between the two kinds is preserved.
         
         Args:
-            address: The OSC address to check
+            messages: Dictionaries with 'address' and optional 'args' keys
             
         Returns:
-            True if the address expects a response
+            A dictionary holding one response per message, in order
         """
-        return address.startswith(self.RESPONSE_PREFIXES)
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(messages)
+        queued: List[Tuple[int, str, list]] = []
+        queries: List[Tuple[int, str, list]] = []
+        
+        for index, message in enumerate(messages):
+            address = message.get('address')
+            args = message.get('args', [])
+            if not address:
+                responses[index] = {
+                    'status': 'error',
+                    'message': 'Missing OSC address'
+                }
+            elif _address_expects_response(address):
+                self._send_queued_messages(queued, responses)
+                queued = []
+                queries.append((index, address, args))
+            else:
+                if queries:
+                    await self._send_queued_queries(queries, responses)
+                    queries = []
+                queued.append((index, address, args))
+        
+        self._send_queued_messages(queued, responses)
+        if queries:
+            await self._send_queued_queries(queries, responses)
+        return {
+            'status': 'success',
+            'responses': responses
+        }
     
     async def _handle_socket_client(self, reader: asyncio.StreamReader, 
                                      writer: asyncio.StreamWriter) -> None:
         """
         Handle an incoming TCP connection from the MCP server.
         
+        The first byte decides the protocol: a bare JSON object starts with
+        '{', anything else is the start of a length-prefixed frame.
+        
         Args:
             reader: The stream reader for the connection
             writer: The stream writer for the connection
@@ -238,33 +1034,11 @@ class AbletonOSCDaemon:
         logger.info(f"Client connected: {client_address}")
         
         try:
-            while True:
-                # Read data from the client
-                data = await reader.read(4096)
-                if not data:
-                    break
-                
-                try:
-                    # Parse the JSON message
-                    message = json.loads(data.decode('utf-8'))
-                    logger.debug(f"Received from {client_address}: {message}")
-                    
-                    # Process the command
-                    response = await self._process_command(message)
-                    
-                    # Send the response
-                    response_data = json.dumps(response).encode('utf-8')
-                    writer.write(response_data)
-                    await writer.drain()
-                    
-                except json.JSONDecodeError as e:
-                    logger.error(f"JSON decode error: {e}")
-                    response = {
-                        'status': 'error',
-                        'message': f'Invalid JSON: {str(e)}'
-                    }
-                    writer.write(json.dumps(response).encode('utf-8'))
-                    await writer.drain()
+            first = await reader.read(1)
+            if first == b'{':
+                await self._serve_legacy_client(reader, writer, client_address, first)
+            elif first:
+                await self._serve_framed_client(reader, writer, client_address, first)
                     
         except asyncio.CancelledError:
             logger.info(f"Connection cancelled: {client_address}")
@@ -280,6 +1054,194 @@ class AbletonOSCDaemon:
                 pass
             logger.info(f"Client disconnected: {client_address}")
     
+    async def _serve_framed_client(self, reader: asyncio.StreamReader,
+                                   writer: asyncio.StreamWriter,
+                                   client_address: Any, prefix: bytes) -> None:
+        """
+        Serve a client speaking the length-prefixed protocol.
+        
+        Each request is processed in its own task, so a query waiting on
+        Ableton doesn't hold up the requests behind it. Responses are
+        written as they complete and matched up by the client using 'id'.
+        
+        Args:
+            reader: The stream reader for the connection
+            writer: The stream writer for the connection
+            client_address: The peer address, for logging
+            prefix: Bytes of the first frame header already read
+        """
+        loop = asyncio.get_running_loop()
+        drain_lock = asyncio.Lock()
+        tasks = set()
+        
+        async def respond(message: Optional[Dict[str, Any]], use_msgpack: bool,
+                          response: Optional[Dict[str, Any]] = None) -> None:
+            try:
+                if response is None:
+                    response = await self._process_command(message)
+                    if 'id' in message:
+                        address = response.get('address')
+                        if response is self._sent_responses.get(address):
+                            # Shared, so fill in its pre-encoded template
+                            response = None
+                            response_data = self._encode_sent_response(
+                                address, message['id'], use_msgpack
+                            )
+                        else:
+                            response['id'] = message['id']
+                
+                if response is not None:
+                    response_data = msgpack.packb(response) if use_msgpack else json_dumps(response)
+                writer.write(FRAME_HEADER.pack(len(response_data)) + response_data)
+                # Small responses just sit in the transport buffer until the
+                # socket takes them; only wait once a backlog builds up
+                if writer.transport.get_write_buffer_size() > self.DRAIN_THRESHOLD:
+                    async with drain_lock:
+                        await writer.drain()
+            except ConnectionError:
+                pass  # the client went away; the connection handler logs it
+            except Exception as e:
+                logger.error(f"Error handling request from {client_address}: {e}")
+        
+        try:
+            while True:
+                try:
+                    header = prefix + await reader.readexactly(FRAME_HEADER.size - len(prefix))
+                    (length,) = FRAME_HEADER.unpack(header)
+                    body = await reader.readexactly(length)
+                except asyncio.IncompleteReadError:
+                    break
+                prefix = b''
+                
+                if body and body[0] == FAST_SEND:
+                    self._handle_fast_frame(body)
+                    continue
+                
+                # JSON objects start with '{' (and a stray JSON array with
+                # '[', a lone integer in msgpack); anything else is msgpack,
+                # and the response is encoded the same way as the request
+                use_msgpack = msgpack is not None and body[:1] not in (b'{', b'[')
+                try:
+                    if use_msgpack:
+                        message = msgpack.unpackb(body, raw=False)
+                    else:
+                        message = json_loads(body)
+                    logger.debug(f"Received from {client_address}: {message}")
+                    if isinstance(message, dict):
+                        task = loop.create_task(respond(message, use_msgpack))
+                    else:
+                        task = loop.create_task(respond(None, use_msgpack, {
+                            'status': 'error',
+                            'message': f'Invalid request: expected a {"msgpack map" if use_msgpack else "JSON object"}'
+                        }))
+                    
+                except ValueError as e:  # includes JSON and msgpack decode errors
+                    logger.error(f"Decode error: {e}")
+                    task = loop.create_task(respond(None, use_msgpack, {
+                        'status': 'error',
+                        'message': f'Invalid {"msgpack" if use_msgpack else "JSON"}: {str(e)}'
+                    }))
+                
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            # Nobody is left to read the responses of unfinished requests
+            for task in tasks:
+                task.cancel()
+    
+    def _handle_fast_frame(self, body: bytes) -> None:
+        """
+        Send the OSC message carried by a compact binary frame.
+        
+        Args:
+            body: The frame body, starting with FAST_SEND
+        """
+        try:
+            _, address_id, argc = FAST_HEADER.unpack_from(body)
+            types = body[FAST_HEADER.size:FAST_HEADER.size + argc]
+            arg_struct = self._fast_structs.get(types)
+            if arg_struct is None:
+                if types.strip(b'if'):
+                    raise ValueError(f'unsupported argument types {types!r}')
+                arg_struct = self._fast_structs[types] = struct.Struct('<' + types.decode('ascii'))
+            args = arg_struct.unpack_from(body, FAST_HEADER.size + argc)
+            address = self.interned_addresses[address_id]
+        except (struct.error, ValueError, IndexError) as e:
+            logger.error(f"Malformed fast frame: {e}")
+            return
+        
+        self._send_osc_fire_and_forget(address, list(args))
+    
+    def _intern_addresses(self, addresses: List[str]) -> Dict[str, Any]:
+        """
+        Assign ids to addresses for use in compact binary frames.
+        
+        Only fire-and-forget addresses can be interned, since binary frames
+        get no response.
+        
+        Args:
+            addresses: The OSC addresses to intern
+            
+        Returns:
+            A dictionary mapping each interned address to its id
+        """
+        ids = {}
+        for address in addresses:
+            if not isinstance(address, str) or _address_expects_response(address):
+                continue
+            if address not in self._address_ids:
+                if len(self.interned_addresses) > 0xFFFF:  # ids are 16-bit
+                    continue
+                self._address_ids[address] = len(self.interned_addresses)
+                self.interned_addresses.append(address)
+            ids[address] = self._address_ids[address]
+        return {
+            'status': 'ok',
+            'ids': ids
+        }
+    
+    async def _serve_legacy_client(self, reader: asyncio.StreamReader,
+                                   writer: asyncio.StreamWriter,
+                                   client_address: Any, data: bytes) -> None:
+        """
+        Serve a client speaking the original unframed protocol.
+        
+        Each read is expected to contain exactly one JSON request, and the
+        response is written back without a length prefix.
+        
+        Args:
+            reader: The stream reader for the connection
+            writer: The stream writer for the connection
+            client_address: The peer address, for logging
+            data: Bytes of the first request already read
+        """
+        data += await reader.read(4096)
+        while data:
+            try:
+                # Parse the JSON message
+                message = json_loads(data)
+                logger.debug(f"Received from {client_address}: {message}")
+                
+                # Process the command
+                response = await self._process_command(message)
+                
+                # Send the response
+                response_data = json_dumps(response)
+                writer.write(response_data)
+                await writer.drain()
+                
+            except json.JSONDecodeError as e:
+                logger.error(f"JSON decode error: {e}")
+                response = {
+                    'status': 'error',
+                    'message': f'Invalid JSON: {str(e)}'
+                }
+                writer.write(json_dumps(response))
+                await writer.drain()
+            
+            # Read data from the client
+            data = await reader.read(4096)
+    
     async def _process_command(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process a command received from the MCP server.
@@ -304,11 +1266,64 @@ class AbletonOSCDaemon:
                 }
             
             # Determine if we should wait for a response
-            if self._expects_response(address):
-                return await self._send_osc_with_response(address, args)
+            if _address_expects_response(address):
+                return await self._send_osc_with_response(address, args, message.get('timeout'))
             else:
                 return self._send_osc_fire_and_forget(address, args)
         
+        elif command == 'send_batch':
+            messages = message.get('messages')
+            
+            if not isinstance(messages, list):
+                return {
+                    'status': 'error',
+                    'message': 'Missing message list'
+                }
+            
+            return await self._send_osc_batch(messages)
+        
+        elif command == 'send_bundle':
+            # Every message is checked and encoded before anything is sent,
+            # so a rejected bundle had no effect and can be resent in parts
+            messages = message.get('messages')
+            
+            if not isinstance(messages, list) or not messages:
+                return {
+                    'status': 'error',
+                    'message': 'Missing message list',
+                    'rejected': True
+                }
+            
+            bundle = []
+            for entry in messages:
+                address = entry.get('address') if isinstance(entry, dict) else None
+                if not address:
+                    return {
+                        'status': 'error',
+                        'message': 'Missing OSC address',
+                        'rejected': True
+                    }
+                if _address_expects_response(address):
+                    return {
+                        'status': 'error',
+                        'message': f'{address} expects a response; use send_batch for queries',
+                        'rejected': True
+                    }
+                bundle.append((address, entry.get('args', [])))
+            
+            return self._send_osc_bundle(bundle)
+        
+        elif command == 'intern_addresses':
+            addresses = message.get('addresses')
+            
+            if not isinstance(addresses, list):
+                return {
+                    'status': 'error',
+                    'message': 'Missing address list'
+                }
+            
+            return self._intern_addresses(addresses)
+        
         elif command == 'get_status':
             return {
                 'status': 'ok',
@@ -316,7 +1331,19 @@ class AbletonOSCDaemon:
                 'ableton_host': self.ableton_host,
                 'ableton_port': self.ableton_port,
                 'receive_port': self.receive_port,
-                'socket_port': self.socket_port
+                'socket_port': self.socket_port,
+                'socket_path': self.socket_path,
+                'telemetry_path': self.telemetry_path,
+                'codecs': MSGPACK_CODECS
+            }
+        
+        elif command == 'clear_cache':
+            # With an address, only what a write to it may have changed
+            address = message.get('address')
+            return {
+                'status': 'ok',
+                'cleared': self._invalidate_responses(address, message.get('args', []))
+                           if isinstance(address, str) else self.clear_cache()
             }
         
         elif command == 'ping':
@@ -339,38 +1366,80 @@ class AbletonOSCDaemon:
         and the TCP server (for receiving from MCP server).
         """
         self._running = True
+        loop = asyncio.get_running_loop()
         
-        # Start OSC server to receive messages from Ableton
+        # Start OSC server to receive messages from Ableton, unless the
+        # first worker receives them for this one
         try:
-            self.osc_server = AsyncIOOSCUDPServer(
-                (self.socket_host, self.receive_port),
-                self.dispatcher,
-                asyncio.get_event_loop()
-            )
-            transport, protocol = await self.osc_server.create_serve_endpoint()
-            logger.info(f"OSC server listening on {self.socket_host}:{self.receive_port}")
+            if self.forward_sock is not None:
+                reader, self._forward_writer = await asyncio.open_connection(sock=self.forward_sock)
+                self._forward_task = loop.create_task(self._read_forwarded_responses(reader))
+                logger.info("Forwarding queries to the first daemon worker")
+            elif sys.platform == 'win32':
+                self.osc_transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+                    lambda: _OscReceiveProtocol(self._handle_packet),
+                    local_addr=(self.socket_host, self.receive_port)
+                )
+            else:
+                self._open_receive_socket()
+            if self.forward_sock is None:
+                logger.info(f"OSC server listening on {self.socket_host}:{self.receive_port}")
+            for sock in self.worker_socks:
+                reader, writer = await asyncio.open_connection(sock=sock)
+                self._worker_tasks.append(loop.create_task(self._handle_socket_client(reader, writer)))
         except Exception as e:
             logger.error(f"Failed to start OSC server: {e}")
             raise
         
-        # Start TCP server for MCP communication
+        if self.telemetry_path:
+            try:
+                self._open_telemetry()
+                logger.info(f"Publishing track meter levels to {self.telemetry_path}")
+            except OSError as e:
+                logger.error(f"Failed to create telemetry buffer: {e}")
+                raise
+        
+        # Start socket server for MCP communication
         try:
-            self.tcp_server = await asyncio.start_server(
-                self._handle_socket_client,
-                self.socket_host,
-                self.socket_port
-            )
-            logger.info(f"TCP server listening on {self.socket_host}:{self.socket_port}")
+            if self.socket_path:
+                # A previous daemon that crashed leaves its socket file behind
+                if os.path.exists(self.socket_path):
+                    os.unlink(self.socket_path)
+                self.tcp_server = await asyncio.start_unix_server(
+                    self._handle_socket_client,
+                    self.socket_path
+                )
+            elif self.reuse_port:
+                # The kernel spreads connections across every process
+                # listening on the port
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                sock.bind((self.socket_host, self.socket_port))
+                self.tcp_server = await asyncio.start_server(
+                    self._handle_socket_client,
+                    sock=sock
+                )
+            else:
+                self.tcp_server = await asyncio.start_server(
+                    self._handle_socket_client,
+                    self.socket_host,
+                    self.socket_port
+                )
+            logger.info(f"Socket server listening on {self.socket_endpoint}")
         except Exception as e:
-            logger.error(f"Failed to start TCP server: {e}")
+            logger.error(f"Failed to start socket server: {e}")
             raise
         
         logger.info("=" * 60)
         logger.info("Ableton OSC Daemon started successfully")
         logger.info("=" * 60)
-        logger.info(f"  MCP Server should connect to: {self.socket_host}:{self.socket_port}")
+        logger.info(f"  MCP Server should connect to: {self.socket_endpoint}")
         logger.info(f"  Sending OSC to Ableton on: {self.ableton_host}:{self.ableton_port}")
-        logger.info(f"  Receiving OSC from Ableton on: {self.socket_host}:{self.receive_port}")
+        if self.forward_sock is None:
+            logger.info(f"  Receiving OSC from Ableton on: {self.socket_host}:{self.receive_port}")
+        else:
+            logger.info("  Receiving OSC from Ableton through the first worker")
         logger.info("")
         logger.info("Make sure Ableton Live is running with AbletonOSC Remote Script enabled.")
         logger.info("=" * 60)
@@ -382,11 +1451,34 @@ class AbletonOSCDaemon:
     async def stop(self) -> None:
         """Stop the OSC daemon gracefully."""
         self._running = False
+        self._flush_bundle()
         
         if self.tcp_server:
             self.tcp_server.close()
             await self.tcp_server.wait_closed()
-            logger.info("TCP server stopped")
+            logger.info("Socket server stopped")
+        
+        if self.socket_path and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        
+        for task in self._worker_tasks:
+            task.cancel()
+        self._worker_tasks = []
+        if self._forward_writer is not None:
+            self._forward_writer.close()
+            self._forward_writer = None
+        
+        if self.receive_sock is not None:
+            asyncio.get_running_loop().remove_reader(self.receive_sock)
+            self.receive_sock.close()
+            self.receive_sock = None
+        if self.osc_transport is not None:
+            self.osc_transport.close()
+            self.osc_transport = None
+        
+        if self.telemetry is not None:
+            self.telemetry.close()
+            self.telemetry = None
         
         logger.info("OSC Daemon stopped")
 
@@ -404,13 +1496,17 @@ Examples:
   python osc_daemon.py
   python osc_daemon.py --socket-port 65432 --ableton-port 11000
   python osc_daemon.py --verbose
+  python osc_daemon.py --workers 4
 
 Environment variables:
   OSC_SOCKET_HOST     Socket server host (default: 127.0.0.1)
   OSC_SOCKET_PORT     Socket server port (default: 65432)
+  OSC_SOCKET_PATH     Unix domain socket path, used instead of host and port
+  OSC_TELEMETRY_PATH  File for the shared memory meter level buffer (disabled by default)
   OSC_ABLETON_HOST    Ableton host (default: 127.0.0.1)
   OSC_ABLETON_PORT    Ableton OSC receive port (default: 11000)
   OSC_RECEIVE_PORT    OSC response receive port (default: 11001)
+  OSC_WORKERS         Number of daemon processes sharing the socket port (default: 1)
         """
     )
     
@@ -420,6 +1516,9 @@ Environment variables:
     parser.add_argument('--socket-port', type=int,
                         default=int(os.environ.get('OSC_SOCKET_PORT', '65432')),
                         help='Port for TCP socket server')
+    parser.add_argument('--socket-path', type=str,
+                        default=os.environ.get('OSC_SOCKET_PATH'),
+                        help='Unix domain socket path, used instead of the TCP socket server')
     parser.add_argument('--ableton-host', type=str,
                         default=os.environ.get('OSC_ABLETON_HOST', '127.0.0.1'),
                         help='Host where Ableton Live is running')
@@ -429,6 +1528,13 @@ Environment variables:
     parser.add_argument('--receive-port', type=int,
                         default=int(os.environ.get('OSC_RECEIVE_PORT', '11001')),
                         help='Port to receive OSC responses from Ableton')
+    parser.add_argument('--telemetry-path', type=str,
+                        default=os.environ.get('OSC_TELEMETRY_PATH'),
+                        help='Publish track meter levels to this file as a shared memory buffer')
+    parser.add_argument('--workers', type=int,
+                        default=int(os.environ.get('OSC_WORKERS', '1')),
+                        help='Number of daemon processes sharing the socket port; the first '
+                             'receives OSC responses and answers queries for the others')
     parser.add_argument('--timeout', type=float, default=5.0,
                         help='Response timeout in seconds')
     parser.add_argument('--verbose', '-v', action='store_true',
@@ -436,10 +1542,42 @@ Environment variables:
     
     args = parser.parse_args()
     
+    if args.workers < 1:
+        parser.error('--workers must be at least 1')
+    if args.workers > 1:
+        if args.socket_path:
+            parser.error('--workers needs the TCP socket server, not --socket-path')
+        if not hasattr(socket, 'SO_REUSEPORT') or not hasattr(os, 'fork'):
+            parser.error('--workers is not supported on this platform')
+    
     # Set logging level
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    # Fork the extra workers before any event loop exists. AbletonOSC
+    # replies to a single port, so only the first worker receives OSC (and
+    # publishes telemetry); the others forward their queries to it over a
+    # socket pair.
+    worker_id = 0
+    children: List[int] = []
+    pairs = [socket.socketpair() for _ in range(1, args.workers)]
+    forward_sock = None
+    for worker in range(1, args.workers):
+        pid = os.fork()
+        if pid == 0:
+            worker_id = worker
+            children = []
+            forward_sock = pairs[worker - 1][1]
+            for first_end, worker_end in pairs:
+                first_end.close()
+                if worker_end is not forward_sock:
+                    worker_end.close()
+            pairs = []
+            break
+        children.append(pid)
+    for _, worker_end in pairs:
+        worker_end.close()
+    
     # Create and start the daemon
     daemon = AbletonOSCDaemon(
         socket_host=args.socket_host,
@@ -447,20 +1585,44 @@ Environment variables:
         ableton_host=args.ableton_host,
         ableton_port=args.ableton_port,
         receive_port=args.receive_port,
-        response_timeout=args.timeout
+        response_timeout=args.timeout,
+        socket_path=args.socket_path,
+        telemetry_path=args.telemetry_path if worker_id == 0 else None,
+        reuse_port=args.workers > 1,
+        forward_sock=forward_sock,
+        worker_socks=[first_end for first_end, _ in pairs]
     )
     
     # Handle shutdown signals
     def signal_handler(sig, frame):
         logger.info("Shutdown signal received")
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        # Keep the first worker's end of the socket pairs open until the
+        # others have exited, so they stop on the signal rather than on a
+        # lost connection
+        for pid in children:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
         sys.exit(0)
     
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
-    # Run the daemon
+    # Run the daemon, on uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+        run = uvloop.run
+    except (ImportError, AttributeError):
+        run = asyncio.run
+    
     try:
-        asyncio.run(daemon.start())
+        run(daemon.start())
     except KeyboardInterrupt:
         logger.info("Daemon stopped by user")
     except Exception as e: